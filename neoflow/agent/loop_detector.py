@@ -7,6 +7,10 @@ from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Parameters that identify what an action operated on; others are ignored
+# when comparing two calls for similarity.
+_KEY_PARAMS = frozenset({"path", "query", "command", "pattern"})
+
 
 @dataclass
 class ActionRecord:
@@ -247,8 +251,8 @@ class LoopDetector:
             True if parameters are similar enough
         """
         # Extract main parameters (ignore minor differences)
-        key_params1 = {k: v for k, v in params1.items() if k in ('path', 'query', 'command', 'pattern')}
-        key_params2 = {k: v for k, v in params2.items() if k in ('path', 'query', 'command', 'pattern')}
+        key_params1 = {k: v for k, v in params1.items() if k in _KEY_PARAMS}
+        key_params2 = {k: v for k, v in params2.items() if k in _KEY_PARAMS}
         
         # If key parameters are identical, consider similar
         if key_params1 == key_params2:
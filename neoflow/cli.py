@@ -1,24 +1,16 @@
 import argparse
-import json
+import atexit
+import functools
 import logging
 import os
+import re
 import sys
-from datetime import datetime
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from types import MappingProxyType
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-
-from neoflow.agent.input import multiline_prompt
-from neoflow.config import Config
+from neoflow.config import Config, ConfigError, get_config
 from neoflow.init import bootstrap_user_resource_folders
-from neoflow.status_bar import StatusBar, status_context
-from neoflow.template import load_template, run_template_form, TemplateError
-from neoflow.weaviate_client import create_weaviate_client
 from neoflow.knowledge_pack import (
     MANIFEST_FILENAME,
     MANUAL_IMPORT_PACK_NAME,
@@ -39,20 +31,40 @@ from neoflow.tool_pack import (
     validate_tool_manifest_from_path,
 )
 
-console = Console()
+
+def _console(stderr: bool = False):
+    """Return the shared stdout (or stderr) console, created on first use."""
+    # Normalized here: lru_cache keys _console() and _console(False) apart.
+    return _stream_console(bool(stderr))
+
+
+@functools.lru_cache(maxsize=2)
+def _stream_console(stderr: bool):
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
+
+# Process-wide Weaviate client, opened on first use and closed at exit.
+_WEAVIATE_CLIENT = None
 
 
 def _confirm_modal(message: str, default: bool = False, title: str = "Confirmation") -> bool:
     """Show a Rich modal-style confirmation message before collecting yes/no input."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
     border_style = "yellow" if default is False else "cyan"
-    console.print(Panel(message, title=title, border_style=border_style, expand=False))
+    _console().print(Panel(message, title=title, border_style=border_style, expand=False))
     return Confirm.ask("Select", default=default)
 
 
 def _setup_logging(verbose: bool = False, info : bool = False, stderr_only: bool = False):
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else (logging.INFO if info else logging.ERROR)
-    # Use stderr console for MCP stdio mode to avoid interfering with JSON-RPC
-    log_console = Console(stderr=True) if stderr_only else console
+    # Use a stderr console for MCP stdio mode to avoid interfering with JSON-RPC
+    log_console = _console(stderr_only)
     logging.basicConfig(
         level=level,
         format="%(message)s",
@@ -60,47 +72,119 @@ def _setup_logging(verbose: bool = False, info : bool = False, stderr_only: bool
     )
 
 
-def _check_services(config: Config):
-    """Verify that Weaviate and Ollama are reachable."""
+def _get_weaviate_client(config: Config):
+    """Return the process-wide Weaviate client, connecting on first use.
+
+    The client stays open for the rest of the command so later stages do not
+    reconnect, and is closed once when the interpreter exits.
+    """
+    global _WEAVIATE_CLIENT
+    if _WEAVIATE_CLIENT is None:
+        from neoflow.weaviate_client import create_weaviate_client
+
+        _WEAVIATE_CLIENT = create_weaviate_client(config, timeout_init=5)
+        atexit.register(_WEAVIATE_CLIENT.close)
+    return _WEAVIATE_CLIENT
+
+
+def _probe_weaviate(config: Config) -> tuple[bool, str]:
+    """Connect the shared Weaviate client; return ``(ok, service_name)``."""
     try:
-        client = create_weaviate_client(config, timeout_init=5, timeout_query=5, timeout_insert=5)
-        client.close()
+        # Attach the client to the config so search tools reuse it, the same
+        # way the LLM provider is shared through ``llm_provider_instance``.
+        config.weaviate_client_instance = _get_weaviate_client(config)
+        return True, "Weaviate"
     except Exception:
-        console.print("[red bold]Cannot connect to Weaviate.[/red bold]")
-        console.print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
-        sys.exit(1)
+        return False, "Weaviate"
 
-    try:
-        import requests
-        urls = [
-            config.llm_provider.ollama_api_url.rstrip("/"),
-            "http://localhost:11434",
+
+def _probe_ollama(config: Config) -> tuple[bool, str]:
+    """Check the Ollama tags endpoint; return ``(ok, service_name)``."""
+    from neoflow.llm_provider import get_http_session
+
+    urls = [
+        config.llm_provider.ollama_api_url.rstrip("/"),
+        "http://localhost:11434",
+    ]
+    for url in dict.fromkeys(urls):  # deduplicate while preserving order
+        try:
+            resp = get_http_session().get(f"{url}/api/tags", timeout=2)
+            if resp.status_code == 200:
+                return True, "Ollama"
+        except Exception:
+            pass
+    return False, "Ollama"
+
+
+def _check_services(config: Config):
+    """Verify that Weaviate and Ollama are reachable.
+
+    Both probes are I/O-bound and independent, so they run concurrently and
+    the wait is the slower of the two rather than their sum.
+    ``NEOFLOW_SKIP_HEALTHCHECK=true`` skips the probes entirely.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if config.cli.skip_healthcheck:
+        return
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_probe_weaviate, config),
+            executor.submit(_probe_ollama, config),
         ]
-        connected = False
-        for url in dict.fromkeys(urls):  # deduplicate while preserving order
-            try:
-                with requests.Session() as session:
-                    resp = session.get(f"{url}/api/tags", timeout=2)
-                if resp.status_code == 200:
-                    connected = True
-                    break
-            except Exception:
-                pass
-        if not connected:
-            raise RuntimeError("unreachable")
-    except Exception:
-        console.print("[red bold]Cannot connect to Ollama.[/red bold]")
-        console.print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
+        results = [future.result() for future in futures]
+
+    failed = [service for ok, service in results if not ok]
+    for service in failed:
+        _console().print(f"[red bold]Cannot connect to {service}.[/red bold]")
+    if failed:
+        _console().print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
         sys.exit(1)
 
 
+def _prewarm_connections(config: Config) -> None:
+    """Warm the Ollama and Weaviate connections on a background thread.
+
+    Runs while the interactive banner is printed so the first query does not
+    pay the connection setup and schema round-trips.
+    """
+    import threading
+
+    def _warm():
+        from neoflow.llm_provider import get_http_session
+
+        try:
+            get_http_session().head(
+                f"{config.llm_provider.ollama_api_url.rstrip('/')}/api/tags", timeout=2
+            )
+        except Exception:
+            pass
+        try:
+            client = _get_weaviate_client(config)
+            # Hand the client to the search tools, as _probe_weaviate does; on
+            # a skipped health check this is where it is first opened.
+            config.weaviate_client_instance = client
+            client.collections.list_all(simple=True)
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm, name="neoflow-prewarm", daemon=True).start()
+
+
 def _weaviate_client(config: Config):
+    from neoflow.weaviate_client import create_weaviate_client
+
     return create_weaviate_client(config)
 
 
 def cmd_search(args, config: Config):
     """Run the search/query pipeline."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.prompt import Prompt
     from neoflow.chat import run_chat
+    from neoflow.status_bar import StatusBar
 
     _check_services(config)
 
@@ -109,7 +193,7 @@ def cmd_search(args, config: Config):
         prompt = args.query
         project_name = args.project or ""
     else:
-        console.print(Panel("NeoFlow Search", style="bold blue"))
+        _console().print(Panel("NeoFlow Search", style="bold blue"))
         prompt = Prompt.ask("[bold]What are you looking for?[/bold]")
         project_name = Prompt.ask(
             "Project name or keyword to filter by", default=""
@@ -126,7 +210,7 @@ def cmd_search(args, config: Config):
         answer = run_chat(
             query=query_text,
             config=config,
-            console=console,
+            console=_console(),
             bar=bar,
             silent=False,
         )
@@ -134,8 +218,8 @@ def cmd_search(args, config: Config):
     finally:
         bar.stop()
 
-    console.print()
-    console.print(Panel(Markdown(answer), title="Answer", border_style="green"))
+    _console().print()
+    _console().print(Panel(Markdown(answer), title="Answer", border_style="green"))
 
     # Save option
     if args.output:
@@ -149,107 +233,144 @@ def cmd_search(args, config: Config):
 def _save_report(content: str, name: str):
     """Save an answer to the reports directory."""
     if not name or any(c in name for c in ('/', '\\', '..')) or os.path.isabs(name):
-        console.print("[red]Invalid filename[/red]")
+        _console().print("[red]Invalid filename[/red]")
         return
-    os.makedirs("reports", exist_ok=True)
-    path = os.path.join("reports", f"{name}.md")
-    with open(path, "w") as f:
-        f.write(content)
-    console.print(f"[green]Saved to {path}[/green]")
+    path = Path("reports") / f"{name}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content.encode("utf-8"))
+    _console().print(f"[green]Saved to {path}[/green]")
 
 
 def cmd_import(args, config: Config):
     """Import tickets, documentation, or zip code into Weaviate."""
-    if getattr(args, "name", None) and not (getattr(args, "zip", None) or getattr(args, "source", None)):
-        console.print("[red bold]--name requires --zip or --source.[/red bold]")
+    # The mode flags form a required mutually exclusive group, so exactly one
+    # is set. Paths are tested against None, not truthiness, so an empty
+    # value is rejected below instead of falling through to tickets.
+    mode = (
+        "tickets" if args.tickets
+        else "docs" if args.docs is not None
+        else "zip" if args.zip is not None
+        else "source"
+    )
+    if mode != "tickets" and not getattr(args, mode).strip():
+        _console().print(f"[red bold]--{mode} requires a non-empty path.[/red bold]")
         sys.exit(1)
+    needs_name = mode in ("zip", "source")
 
-    if getattr(args, "docs", None):
-        args.path = args.docs
-        cmd_import_documentation(args, config)
-        return
+    if args.name and not needs_name:
+        _console().print("[red bold]--name requires --zip or --source.[/red bold]")
+        sys.exit(1)
+    if needs_name and not args.name:
+        _console().print(f"[red bold]--{mode} requires --name.[/red bold]")
+        sys.exit(1)
 
-    if getattr(args, "zip", None):
-        if not getattr(args, "name", None):
-            console.print("[red bold]--zip requires --name.[/red bold]")
-            sys.exit(1)
-        args.file = args.zip
-        cmd_import_zip(args, config)
-        return
+    target_attr, handler = _IMPORT_MODES[mode]
+    if target_attr:
+        setattr(args, target_attr, getattr(args, mode))
+    handler(args, config)
 
-    if getattr(args, "source", None):
-        if not getattr(args, "name", None):
-            console.print("[red bold]--source requires --name.[/red bold]")
-            sys.exit(1)
-        args.path = args.source
-        cmd_import_source(args, config)
-        return
 
-    if getattr(args, "tickets", False):
-        from neoflow.importer.importer import import_tickets
+def cmd_import_tickets(args, config: Config):
+    """Import ticket data into Weaviate."""
+    from neoflow.importer.importer import import_tickets
 
-        _check_services(config)
-        import_tickets(config, pack_name=MANUAL_IMPORT_PACK_NAME)
-        return
+    _check_services(config)
+    import_tickets(
+        config,
+        pack_name=MANUAL_IMPORT_PACK_NAME,
+        client=_get_weaviate_client(config),
+    )
 
 
 def cmd_import_documentation(args, config: Config):
     """Import documentation files into Weaviate."""
     from neoflow.importer.documentation import import_documentation
 
-    _check_services(config)
-
     doc_path = args.path
     if not os.path.isdir(doc_path):
-        console.print(f"[red bold]Directory not found: {doc_path}[/red bold]")
+        _console().print(f"[red bold]Directory not found: {doc_path}[/red bold]")
         sys.exit(1)
 
-    console.print(f"Importing documentation from [cyan]{doc_path}[/cyan]...")
+    _check_services(config)
+
+    _console().print(f"Importing documentation from [cyan]{doc_path}[/cyan]...")
 
-    with console.status("[bold green]Importing documentation files..."):
-        count = import_documentation(doc_path, config, pack_name=MANUAL_IMPORT_PACK_NAME)
+    with _console().status("[bold green]Importing documentation files..."):
+        count = import_documentation(
+            doc_path,
+            config,
+            pack_name=MANUAL_IMPORT_PACK_NAME,
+            client=_get_weaviate_client(config),
+        )
 
-    console.print(f"[green]Documentation import complete: {count} chunks indexed.[/green]")
+    _console().print(f"[green]Documentation import complete: {count} chunks indexed.[/green]")
 
 
 def cmd_import_zip(args, config: Config):
     """Import code from a zip file into the CodeSnippets collection."""
     from neoflow.importer.code_indexer import index_zip_file
 
-    _check_services(config)
-
     zip_path = args.file
     if not os.path.isfile(zip_path):
-        console.print(f"[red bold]File not found: {zip_path}[/red bold]")
+        _console().print(f"[red bold]File not found: {zip_path}[/red bold]")
         sys.exit(1)
 
-    repo_name = args.name
-    console.print(f"Importing [cyan]{zip_path}[/cyan] as [cyan]{repo_name}[/cyan]...")
+    _check_services(config)
 
-    with console.status("[bold green]Extracting and indexing code from zip..."):
-        index_zip_file(zip_path, repo_name, config, pack_name=MANUAL_IMPORT_PACK_NAME)
+    repo_name = args.name
+    _console().print(f"Importing [cyan]{zip_path}[/cyan] as [cyan]{repo_name}[/cyan]...")
+
+    with _console().status("[bold green]Extracting and indexing code from zip..."):
+        index_zip_file(
+            zip_path,
+            repo_name,
+            config,
+            pack_name=MANUAL_IMPORT_PACK_NAME,
+            client=_get_weaviate_client(config),
+        )
 
-    console.print(f"[green]Zip import complete: {repo_name}[/green]")
+    _console().print(f"[green]Zip import complete: {repo_name}[/green]")
 
 
 def cmd_import_source(args, config: Config):
     """Import code from a source folder into the CodeSnippets collection."""
     from neoflow.importer.code_indexer import index_source_folder
 
-    _check_services(config)
-
     source_path = args.path
     if not os.path.isdir(source_path):
-        console.print(f"[red bold]Directory not found: {source_path}[/red bold]")
+        _console().print(f"[red bold]Directory not found: {source_path}[/red bold]")
         sys.exit(1)
 
+    _check_services(config)
+
     repo_name = args.name
-    console.print(f"Importing source from [cyan]{source_path}[/cyan] as [cyan]{repo_name}[/cyan]...")
+    _console().print(f"Importing source from [cyan]{source_path}[/cyan] as [cyan]{repo_name}[/cyan]...")
+
+    with _console().status("[bold green]Indexing code from source folder..."):
+        index_source_folder(
+            source_path,
+            repo_name,
+            config,
+            pack_name=MANUAL_IMPORT_PACK_NAME,
+            client=_get_weaviate_client(config),
+        )
+
+    _console().print(f"[green]Source import complete: {repo_name}[/green]")
+
 
-    with console.status("[bold green]Indexing code from source folder..."):
-        index_source_folder(source_path, repo_name, config, pack_name=MANUAL_IMPORT_PACK_NAME)
+# Import mode -> (args attribute the handler reads the mode value from, handler)
+_IMPORT_MODES = {
+    "tickets": (None, cmd_import_tickets),
+    "docs": ("path", cmd_import_documentation),
+    "zip": ("file", cmd_import_zip),
+    "source": ("path", cmd_import_source),
+}
 
-    console.print(f"[green]Source import complete: {repo_name}[/green]")
+
+@functools.lru_cache(maxsize=1)
+def _env_template() -> str:
+    """Return the .env template text, generated once per process."""
+    return Config.generate_env_template()
 
 
 def cmd_config(args, config: Config):
@@ -263,28 +384,25 @@ def cmd_config(args, config: Config):
             default=False,
             title="Overwrite Existing File",
         ):
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
     
-    # Generate the template
-    env_content = Config.generate_env_template()
-    
-    # Write to file
-    with open(output_path, "w") as f:
-        f.write(env_content)
+    Path(output_path).write_bytes(_env_template().encode("utf-8"))
     
-    console.print(f"[green]✓ Generated configuration template: {output_path}[/green]")
-    console.print(f"[dim]Edit the file and uncomment/modify values as needed.[/dim]")
+    _console().print(f"[green]✓ Generated configuration template: {output_path}[/green]")
+    _console().print(f"[dim]Edit the file and uncomment/modify values as needed.[/dim]")
 
 
 def cmd_db_clear(args, config: Config):
+    from rich.prompt import Confirm
+
     collection_name = getattr(args, "collection", None)
 
     try:
         client = _weaviate_client(config)
     except Exception:
-        console.print("[red bold]Cannot connect to Weaviate.[/red bold]")
-        console.print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
+        _console().print("[red bold]Cannot connect to Weaviate.[/red bold]")
+        _console().print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
         sys.exit(1)
 
     try:
@@ -292,13 +410,13 @@ def cmd_db_clear(args, config: Config):
 
         if collection_name:
             if collection_name not in set(existing):
-                console.print(f"[yellow]Collection '{collection_name}' does not exist.[/yellow]")
+                _console().print(f"[yellow]Collection '{collection_name}' does not exist.[/yellow]")
                 if existing:
-                    console.print("Available collections:")
+                    _console().print("Available collections:")
                     for name in existing:
-                        console.print(f"- {name}")
+                        _console().print(f"- {name}")
                 else:
-                    console.print("[yellow]No collections found.[/yellow]")
+                    _console().print("[yellow]No collections found.[/yellow]")
                 return
 
             confirmed = Confirm.ask(
@@ -306,45 +424,47 @@ def cmd_db_clear(args, config: Config):
                 default=False,
             )
             if not confirmed:
-                console.print("[yellow]Operation cancelled.[/yellow]")
+                _console().print("[yellow]Operation cancelled.[/yellow]")
                 return
 
             client.collections.delete(collection_name)
-            console.print(f"[green]✓ Deleted collection: {collection_name}[/green]")
+            _console().print(f"[green]✓ Deleted collection: {collection_name}[/green]")
             return
 
         if not existing:
-            console.print("[yellow]No collections found.[/yellow]")
+            _console().print("[yellow]No collections found.[/yellow]")
             return
 
-        console.print("Collections available to clear:")
+        _console().print("Collections available to clear:")
         for name in existing:
-            console.print(f"- {name}")
+            _console().print(f"- {name}")
 
         confirmed = Confirm.ask(
             "Are you sure you want to delete ALL collections?",
             default=False,
         )
         if not confirmed:
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
 
-        console.print(f"Deleting {len(existing)} collection(s)...")
+        _console().print(f"Deleting {len(existing)} collection(s)...")
         for name in existing:
             client.collections.delete(name)
-            console.print(f"[green]✓ Deleted: {name}[/green]")
+            _console().print(f"[green]✓ Deleted: {name}[/green]")
 
-        console.print("[green]All collections cleared successfully.[/green]")
+        _console().print("[green]All collections cleared successfully.[/green]")
     finally:
         client.close()
 
 
 def cmd_db_list(args, config: Config):
+    from rich.table import Table
+
     try:
         client = _weaviate_client(config)
     except Exception:
-        console.print("[red bold]Cannot connect to Weaviate.[/red bold]")
-        console.print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
+        _console().print("[red bold]Cannot connect to Weaviate.[/red bold]")
+        _console().print("Make sure it's running: [cyan]docker compose up -d[/cyan]")
         sys.exit(1)
 
     try:
@@ -353,7 +473,7 @@ def cmd_db_list(args, config: Config):
         client.close()
 
     if not existing:
-        console.print("[yellow]No collections found.[/yellow]")
+        _console().print("[yellow]No collections found.[/yellow]")
         return
 
     table = Table(title="Weaviate Collections", show_header=True, border_style="blue")
@@ -361,7 +481,7 @@ def cmd_db_list(args, config: Config):
     table.add_column("Collection", style="cyan")
     for index, name in enumerate(existing, start=1):
         table.add_row(str(index), name)
-    console.print(table)
+    _console().print(table)
 
 
 def cmd_db(args, config: Config):
@@ -373,10 +493,12 @@ def cmd_db(args, config: Config):
         cmd_db_list(args, config)
         return
 
-    console.print("[red]Please specify a valid db subcommand. Use: neoflow db --help[/red]")
+    _console().print("[red]Please specify a valid db subcommand. Use: neoflow db --help[/red]")
 
 
 def _print_pack_metadata(metadata_block: dict):
+    from rich.table import Table
+
     table = Table(title="Knowledge Pack Metadata", show_header=True, border_style="blue")
     table.add_column("Field", style="bold cyan")
     table.add_column("Value")
@@ -391,7 +513,7 @@ def _print_pack_metadata(metadata_block: dict):
         "tag",
     ):
         table.add_row(field, str(metadata_block.get(field, "")))
-    console.print(table)
+    _console().print(table)
 
 
 def _load_manifest_for_install_preview(package_file: str) -> dict:
@@ -419,38 +541,40 @@ def _load_manifest_for_install_preview(package_file: str) -> dict:
 
 
 def cmd_knowledge_pack(args, config: Config):
+    from rich.table import Table
+
     if args.build:
         source_path = args.target
-        console.print("Checking manifest info...")
+        _console().print("Checking manifest info...")
         try:
             validation = validate_manifest_from_path(Path(source_path).expanduser().resolve())
         except FileNotFoundError:
-            console.print("[red]Invalid manifest[/red]")
-            console.print("[red]- manifest.json not found[/red]")
+            _console().print("[red]Invalid manifest[/red]")
+            _console().print("[red]- manifest.json not found[/red]")
             sys.exit(1)
         except Exception as exc:
-            console.print("[red]Invalid manifest[/red]")
-            console.print(f"[red]- {exc}[/red]")
+            _console().print("[red]Invalid manifest[/red]")
+            _console().print(f"[red]- {exc}[/red]")
             sys.exit(1)
 
         if validation.errors:
-            console.print("[red]Invalid manifest[/red]")
+            _console().print("[red]Invalid manifest[/red]")
             for error in validation.errors:
-                console.print(f"[red]- {error}[/red]")
+                _console().print(f"[red]- {error}[/red]")
             sys.exit(1)
 
-        console.print("[green]Manifest is valid![/green]")
-        console.print("Building...")
+        _console().print("[green]Manifest is valid![/green]")
+        _console().print("Building...")
         try:
             package_path, _ = build_knowledge_pack(source_path, output_dir=args.output)
         except Exception as exc:
-            console.print("[red]Build fail[/red]")
-            console.print(f"[red]{exc}[/red]")
+            _console().print("[red]Build fail[/red]")
+            _console().print(f"[red]{exc}[/red]")
             sys.exit(1)
 
-        console.print("[green]Build complete[/green]")
-        console.print(f"Package generated: {package_path.name}")
-        console.print(str(package_path.resolve()))
+        _console().print("[green]Build complete[/green]")
+        _console().print(f"Package generated: {package_path.name}")
+        _console().print(str(package_path.resolve()))
         return
 
     if args.install:
@@ -458,16 +582,16 @@ def cmd_knowledge_pack(args, config: Config):
         try:
             manifest = _load_manifest_for_install_preview(args.target)
         except Exception:
-            console.print("[red]knowledge pack invalid, unable to install it![/red]")
+            _console().print("[red]knowledge pack invalid, unable to install it![/red]")
             sys.exit(1)
 
         _print_pack_metadata(manifest.get("metadata", {}))
         if not _confirm_modal("Install this knowledge pack?", default=False, title="Install"):
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
 
         pack_display_name = manifest.get('metadata', {}).get('name', '')
-        with console.status(f"[bold green]Installing knowledge pack {pack_display_name}[/bold green]") as status:
+        with _console().status(f"[bold green]Installing knowledge pack {pack_display_name}[/bold green]") as status:
             try:
                 def _on_install_progress(step: int, total: int, label: str) -> None:
                     status.update(
@@ -479,31 +603,29 @@ def cmd_knowledge_pack(args, config: Config):
             except ValueError as exc:
                 message = str(exc)
                 if "already installed" in message:
-                    console.print(f"[yellow]{message}[/yellow]")
+                    _console().print(f"[yellow]{message}[/yellow]")
                     return
                 if "Invalid manifest" in message:
-                    console.print("[red]knowledge pack invalid, unable to install it![/red]")
+                    _console().print("[red]knowledge pack invalid, unable to install it![/red]")
                     return
-                console.print("[red]Not able to install knowledge pack![/red]")
-                console.print(f"[red]{message}[/red]")
+                _console().print("[red]Not able to install knowledge pack![/red]")
+                _console().print(f"[red]{message}[/red]")
                 sys.exit(1)
             except Exception as exc:
-                console.print("[red]Not able to install knowledge pack![/red]")
-                console.print(f"[red]{exc}[/red]")
+                _console().print("[red]Not able to install knowledge pack![/red]")
+                _console().print(f"[red]{exc}[/red]")
                 sys.exit(1)
 
-        console.print("[green]knowledge pack Installed.[/green]")
+        _console().print("[green]knowledge pack Installed.[/green]")
         return
 
     if args.uninstall:
-        _check_services(config)
-
         metadata_for_prompt = {"name": args.target}
         registry = load_registry()
         if args.target != MANUAL_IMPORT_PACK_NAME:
             entry = resolve_registry_entry(registry, args.target)
             if not entry:
-                console.print(f"[red]Knowledge pack not found: {args.target}[/red]")
+                _console().print(f"[red]Knowledge pack not found: {args.target}[/red]")
                 sys.exit(1)
             metadata_for_prompt = {
                 "name": entry.get("name", ""),
@@ -512,26 +634,28 @@ def cmd_knowledge_pack(args, config: Config):
                 "tag": entry.get("tag", ""),
             }
 
+        _check_services(config)
+
         _print_pack_metadata(metadata_for_prompt)
         if not _confirm_modal("Uninstall this knowledge pack?", default=False, title="Uninstall"):
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
 
-        with console.status(f"[bold green]Uninstalling knowledge pack {metadata_for_prompt.get('name', '')}[/bold green]"):
+        with _console().status(f"[bold green]Uninstalling knowledge pack {metadata_for_prompt.get('name', '')}[/bold green]"):
             try:
                 uninstall_knowledge_pack(args.target, config, keep_domain=args.keep_domain)
             except Exception as exc:
-                console.print("[red]Not able to uninstall knowledge pack![/red]")
-                console.print(f"[red]{exc}[/red]")
+                _console().print("[red]Not able to uninstall knowledge pack![/red]")
+                _console().print(f"[red]{exc}[/red]")
                 sys.exit(1)
 
-        console.print("[green]knowledge pack Removed.[/green]")
+        _console().print("[green]knowledge pack Removed.[/green]")
         return
 
     if args.list:
         packs = list_knowledge_packs()
         if not packs:
-            console.print("No knowledge packs installed.")
+            _console().print("No knowledge packs installed.")
             return
 
         table = Table(title="Installed Knowledge Packs", show_header=True, border_style="blue")
@@ -546,12 +670,14 @@ def cmd_knowledge_pack(args, config: Config):
                 str(item.get("description", "")),
                 str(item.get("pack-name", "")),
             )
-        console.print(table)
+        _console().print(table)
         return
 
 
 def _print_chat_help():
     """Print available chat commands."""
+    from rich.table import Table
+
     table = Table(title="Chat Commands", show_header=True, border_style="blue")
     table.add_column("Command", style="bold cyan")
     table.add_column("Description")
@@ -565,14 +691,15 @@ def _print_chat_help():
     table.add_row("/init", "Create a .neoflow/ project config folder in the current directory")
     table.add_row("/tools", "List all tools available to the agent (built-ins + installed packs)")
     table.add_row("/help", "Show this help message")
-    console.print(table)
-    console.print()
+    _console().print(table)
+    _console().print()
 
 
 def _print_tools_table(config: Config):
     """Print all tools registered in the agent's tool registry."""
-    from neoflow.agent.tool_registry import ToolRegistry, RESERVED_TOOL_NAMES
+    from rich.table import Table
     from neoflow.agent.agent import _load_installed_tool_packs
+    from neoflow.agent.tool_registry import ToolRegistry, RESERVED_TOOL_NAMES
 
     registry = ToolRegistry()
     _load_installed_tool_packs(registry, config)
@@ -605,37 +732,23 @@ def _print_tools_table(config: Config):
         return t
 
     if builtin_tools:
-        console.print(_make_table("Built-in Tools", builtin_tools, "blue"))
+        _console().print(_make_table("Built-in Tools", builtin_tools, "blue"))
 
     if pack_tools:
-        console.print(_make_table("Installed Tool Packs", pack_tools, "yellow"))
+        _console().print(_make_table("Installed Tool Packs", pack_tools, "yellow"))
     else:
-        console.print("[dim]No tool packs installed.[/dim]")
+        _console().print("[dim]No tool packs installed.[/dim]")
 
-    console.print(
+    _console().print(
         f"\n[dim]{len(builtin_tools)} built-in tool(s), {len(pack_tools)} pack tool(s). "
         "Use [bold]#tool_name text[/bold] to invoke a pack tool directly.[/dim]\n"
     )
 
 
-def _save_chat_history(history: list[dict], config: Config):
-    """Persist the conversation history to disk."""
-    if not config.chat.save_history:
-        return
-    os.makedirs(config.chat.history_dir, exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.join(config.chat.history_dir, f"chat_{ts}.json")
-    with open(path, "w") as f:
-        json.dump(history, f, indent=2)
-    console.print(f"[dim]Chat history saved to {path}[/dim]")
-
-
 def cmd_agent(args, config: Config):
     """Run the agent on a task directly from the command line."""
     from neoflow.agent.agent import run_agent
 
-    _check_services(config)
-
     # Build task string — prefix @domain mentions for each --domain flag
     task_parts = []
     for domain in getattr(args, "domain", None) or []:
@@ -645,21 +758,27 @@ def cmd_agent(args, config: Config):
 
     # --no-planning disables the planning phase
     if getattr(args, "no_planning", False):
-        config.agent.planning_enabled = False
+        config.agent = replace(config.agent, planning_enabled=False)
 
     # --working-dir changes the working directory for file and command actions
     working_dir = getattr(args, "working_dir", None)
     if working_dir:
         if not os.path.isdir(working_dir):
-            console.print(f"[red bold]Working directory not found: {working_dir}[/red bold]")
+            _console().print(f"[red bold]Working directory not found: {working_dir}[/red bold]")
             sys.exit(1)
+
+    _check_services(config)
+
+    if working_dir:
         os.chdir(working_dir)
 
-    run_agent(task, config, console)
+    run_agent(task, config, _console())
 
 
 def cmd_serve(args, config: Config):
     """Start the FastAPI REST API server."""
+    import importlib.util
+
     import uvicorn
     from neoflow.api.server import create_app
 
@@ -668,10 +787,15 @@ def cmd_serve(args, config: Config):
     host = args.host or config.server.host
     port = args.port or config.server.port
 
-    console.print(f"[green]Starting NeoFlow API server on {host}:{port}[/green]")
-    console.print(f"[dim]OpenAPI docs: http://{host}:{port}/docs[/dim]")
-    console.print(f"[dim]ReDoc docs: http://{host}:{port}/redoc[/dim]")
-    console.print()
+    _console().print(f"[green]Starting NeoFlow API server on {host}:{port}[/green]")
+    _console().print(f"[dim]OpenAPI docs: http://{host}:{port}/docs[/dim]")
+    _console().print(f"[dim]ReDoc docs: http://{host}:{port}/redoc[/dim]")
+    _console().print()
+
+    # Prefer the libuv event loop and C HTTP parser shipped with
+    # uvicorn[standard]; fall back to the pure-Python ones when missing.
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http_impl = "httptools" if importlib.util.find_spec("httptools") else "h11"
 
     app = create_app(config)
     uvicorn.run(
@@ -680,6 +804,8 @@ def cmd_serve(args, config: Config):
         port=port,
         reload=args.reload,
         log_level="info",
+        loop=loop_impl,
+        http=http_impl,
     )
 
 
@@ -689,31 +815,31 @@ def cmd_mcp_server(args, config: Config):
     from neoflow.mcp.server import run_mcp_server
 
     if not config.mcp.enabled:
-        console.print("[yellow]MCP server is disabled in configuration[/yellow]")
-        console.print("Set MCP_ENABLED=true in your environment to enable it")
+        _console().print("[yellow]MCP server is disabled in configuration[/yellow]")
+        _console().print("Set MCP_ENABLED=true in your environment to enable it")
         sys.exit(1)
 
     transport = args.transport or config.mcp.transport
 
     # For stdio transport, redirect all output to stderr to avoid interfering with JSON-RPC
     if transport == "stdio":
-        stderr_console = Console(stderr=True)
+        stderr_console = _console(True)
         stderr_console.print("[green bold]Starting NeoFlow MCP server[/green bold]")
         stderr_console.print(f"[dim]Transport: {transport}[/dim]")
         stderr_console.print(f"[dim]Available tools: ask_chat, search_code, search_documentation, search_tickets, get_full_ticket[/dim]")
         stderr_console.print("[dim]Listening on stdio (for MCP clients like VS Code, Claude Desktop)...[/dim]")
         stderr_console.print(f"[dim]Press Ctrl+C to stop[/dim]")
     else:
-        console.print("[green bold]Starting NeoFlow MCP server[/green bold]")
-        console.print(f"[dim]Transport: {transport}[/dim]")
-        console.print(f"[dim]Available tools: ask_chat, search_code, search_documentation, search_tickets, get_full_ticket[/dim]")
-        console.print(f"[dim]Listening on {config.mcp.sse_host}:{config.mcp.sse_port}...[/dim]")
-        console.print(f"[dim]Press Ctrl+C to stop[/dim]")
+        _console().print("[green bold]Starting NeoFlow MCP server[/green bold]")
+        _console().print(f"[dim]Transport: {transport}[/dim]")
+        _console().print(f"[dim]Available tools: ask_chat, search_code, search_documentation, search_tickets, get_full_ticket[/dim]")
+        _console().print(f"[dim]Listening on {config.mcp.sse_host}:{config.mcp.sse_port}...[/dim]")
+        _console().print(f"[dim]Press Ctrl+C to stop[/dim]")
 
     try:
         asyncio.run(run_mcp_server(transport=transport, config=config))
     except KeyboardInterrupt:
-        stderr_console = Console(stderr=True) if transport == "stdio" else console
+        stderr_console = _console(transport == "stdio")
         stderr_console.print("\n[yellow]MCP server stopped by user[/yellow]")
 
 
@@ -725,23 +851,23 @@ def cmd_mcp_proxy(args, config: Config):
     remote_url = args.remote_url
     auth_token = args.auth_token or config.mcp.auth_token
 
-    console.print("[green bold]Starting NeoFlow MCP HTTP Proxy[/green bold]")
-    console.print(f"[dim]Connecting to: {remote_url}[/dim]")
-    console.print(f"[dim]Local protocol: stdio (for VS Code, etc.)[/dim]")
-    console.print(f"[dim]Remote protocol: HTTP/SSE[/dim]")
+    _console().print("[green bold]Starting NeoFlow MCP HTTP Proxy[/green bold]")
+    _console().print(f"[dim]Connecting to: {remote_url}[/dim]")
+    _console().print(f"[dim]Local protocol: stdio (for VS Code, etc.)[/dim]")
+    _console().print(f"[dim]Remote protocol: HTTP/SSE[/dim]")
     if auth_token:
-        console.print(f"[dim]Authentication: enabled[/dim]")
-    console.print(f"[dim]Press Ctrl+C to stop[/dim]")
+        _console().print(f"[dim]Authentication: enabled[/dim]")
+    _console().print(f"[dim]Press Ctrl+C to stop[/dim]")
 
     try:
         asyncio.run(run_proxy(remote_url=remote_url, auth_token=auth_token))
     except KeyboardInterrupt:
-        console.print("\n[yellow]MCP proxy stopped by user[/yellow]")
+        _console().print("\n[yellow]MCP proxy stopped by user[/yellow]")
 
 
 def _resolve_server_mode(args) -> str | None:
     """Resolve requested server mode from command/flags."""
-    command = getattr(args, "command", None)
+    command = args.command
 
     if command == "serve":
         return "rest"
@@ -752,11 +878,12 @@ def _resolve_server_mode(args) -> str | None:
     if command != "server":
         return None
 
-    if getattr(args, "rest", False):
+    # The server subparser always defines these flags.
+    if args.rest:
         return "rest"
-    if getattr(args, "mcp", False):
+    if args.mcp:
         return "mcp"
-    if getattr(args, "proxy", False):
+    if args.proxy:
         return "proxy"
 
     return None
@@ -767,8 +894,8 @@ def cmd_server(args, config: Config):
     mode = _resolve_server_mode(args)
 
     if mode is None:
-        console.print("[red bold]Choose one mode: --rest, --mcp, or --proxy[/red bold]")
-        console.print("Examples: [cyan]neoflow server --rest[/cyan], [cyan]neoflow server --mcp[/cyan], [cyan]neoflow server --proxy --remote-url http://host:9721[/cyan]")
+        _console().print("[red bold]Choose one mode: --rest, --mcp, or --proxy[/red bold]")
+        _console().print("Examples: [cyan]neoflow server --rest[/cyan], [cyan]neoflow server --mcp[/cyan], [cyan]neoflow server --proxy --remote-url http://host:9721[/cyan]")
         sys.exit(1)
 
     if mode == "rest":
@@ -780,27 +907,14 @@ def cmd_server(args, config: Config):
         return
 
     if not getattr(args, "remote_url", None):
-        console.print("[red bold]--remote-url is required with --proxy[/red bold]")
+        _console().print("[red bold]--remote-url is required with --proxy[/red bold]")
         sys.exit(1)
 
     cmd_mcp_proxy(args, config)
 
 
-def cmd_interactive(args, config: Config):
-    """Run an interactive chat session with slash-command support."""
-    from neoflow.chat import run_chat
-
-    _check_services(config)
-
-    # Session state
-    history: list[dict] = []
-    last_query: str | None = None
-    last_keyword: str = ""
-    last_answer: str | None = None
-    agent_mode: bool = False
-
-    # Define your logo/ASCII art
-    logo = """
+# ASCII art shown at the top of the interactive session.
+_LOGO = """
 ███╗   ██╗███████╗ ██████╗ ███████╗██╗      ██████╗ ██╗    ██╗
 ████╗  ██║██╔════╝██╔═══██╗██╔════╝██║     ██╔═══██╗██║    ██║
 ██╔██╗ ██║█████╗  ██║   ██║█████╗  ██║     ██║   ██║██║ █╗ ██║
@@ -809,18 +923,17 @@ def cmd_interactive(args, config: Config):
 ╚═╝  ╚═══╝╚══════╝ ╚═════╝ ╚═╝     ╚══════╝ ╚═════╝  ╚══╝╚══╝ 
  """
 
-    # Create header content
-    header_content = f"""
-    {logo}      
-    """  
-    from importlib import metadata 
-    header_info = f"""
-[bold blue]NeoFlow[/bold blue] - Version {metadata.version("neoflow")}
+# Banner pieces, assembled once; only the session settings are filled in.
+_BANNER_LOGO = f"""
+    {_LOGO}      
+    """
+_BANNER_INFO_TEMPLATE = """
+[bold blue]NeoFlow[/bold blue] - Version {version}
 [bold green]Created by[/bold green]: Tadeu Arias
-[bold green]Model[/bold green]: {config.llm_provider.ollama_model}
-[bold green]Provider [/bold green]: {config.llm_provider.provider}
-[bold green]History[/bold green]: {'on' if config.chat.save_history else 'off'}
-[bold green]Agent Guardrails[/bold green]: {'off' if config.agent.unsafe_mode else 'on'}
+[bold green]Model[/bold green]: {model}
+[bold green]Provider [/bold green]: {provider}
+[bold green]History[/bold green]: {history}
+[bold green]Agent Guardrails[/bold green]: {guardrails}
 
 Type [bold green]/init[/bold green] to create the local config.
 
@@ -828,27 +941,288 @@ Contact:
  - LinkedIn: [cyan]https://www.linkedin.com/in/traneo/[/cyan]
     """
 
-    from rich.layout import Layout
 
-    head_section = Layout(name="Welcome")
-    head_section.split_row(
-        Layout(header_content, name="Header", ratio=4),
-        Layout(header_info, name="Info", ratio=2),
+@functools.lru_cache(maxsize=1)
+def _neoflow_version() -> str:
+    """Return the installed NeoFlow version, resolved once per process."""
+    from importlib import metadata
+
+    try:
+        return metadata.version("neoflow")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class _VersionAction(argparse.Action):
+    """``--version`` that looks the version up only when the flag is given."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default,
+                         nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"{parser.prog} {_neoflow_version()}")
+        parser.exit()
+
+
+@functools.lru_cache(maxsize=4)
+def _build_header(model: str, provider: str, save_history: bool, unsafe_mode: bool):
+    """Build the interactive welcome banner for the given session settings."""
+    from rich.table import Table
+
+    header_info = _BANNER_INFO_TEMPLATE.format(
+        version=_neoflow_version(),
+        model=model,
+        provider=provider,
+        history="on" if save_history else "off",
+        guardrails="off" if unsafe_mode else "on",
     )
 
+    # A borderless two-column grid renders the logo and info side by side
+    # without the full-screen layout engine.
+    head_section = Table.grid(expand=True)
+    head_section.add_column(ratio=4)
+    head_section.add_column(ratio=2)
+    head_section.add_row(_BANNER_LOGO, header_info)
+    return head_section
+
+
+@dataclass(slots=True)
+class ChatTurn:
+    """One answered query in an interactive chat session."""
+
+    timestamp: str
+    keyword: str
+    query: str
+    answer: str
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Mutable state of one interactive chat session."""
+
+    history: list[ChatTurn] = field(default_factory=list)
+    last_query: str | None = None
+    last_keyword: str = ""
+    last_answer: str | None = None
+    agent_mode: bool = False
+    done: bool = False
+    history_path: Path | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _history_encoder():
+    """Return a function encoding a ``ChatTurn`` as compact UTF-8 JSON.
+
+    Uses orjson (which serializes dataclasses natively) when installed and
+    falls back to ``json`` with compact separators otherwise; the choice is
+    made once per process.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        from dataclasses import asdict
+
+        return lambda turn: json.dumps(asdict(turn), separators=(",", ":")).encode("utf-8")
+    return orjson.dumps
+
+
+def _append_chat_history(turn: ChatTurn, state: SessionState, config: Config):
+    """Append one chat turn to the session's JSONL history file.
+
+    Turns are written as they happen, so the history survives a crash and
+    no session-sized document is ever re-serialized.
+    """
+    if not config.chat.save_history:
+        return
+    if state.history_path is None:
+        from datetime import datetime
+
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        state.history_path = Path(config.chat.history_dir) / f"chat_{ts}.jsonl"
+        state.history_path.parent.mkdir(parents=True, exist_ok=True)
+    with state.history_path.open("ab") as f:
+        f.write(_history_encoder()(turn) + b"\n")
+
+
+def _finish_chat_history(state: SessionState):
+    """Report the session's history file; the next turn starts a new one."""
+    if state.history_path is None:
+        return
+    _console().print(f"[dim]Chat history saved to {state.history_path}[/dim]")
+    state.history_path = None
+
+
+_PROMPT_AGENT = "<magenta><b>BugSummoner &gt; </b></magenta>"
+_PROMPT_NORMAL = "<cyan><b>AI_Overlord &gt; </b></cyan>"
+
 
-    console.print(head_section, height=12)
-    console.print("Type [bold]/help[/bold] to see available commands.")
-    console.print("[dim]Multiline: Enter for newline, empty line to submit.[/dim]\n")
+# Slash-command handlers take the raw input, the session state and the config.
+# They return a ``(query, keyword)`` pair when a search should run, else None.
+
+def _handle_exit(user_input: str, state: SessionState, config: Config):
+    _finish_chat_history(state)
+    _console().print("[bold]Goodbye![/bold]")
+    state.done = True
+
+
+def _handle_help(user_input: str, state: SessionState, config: Config):
+    _print_chat_help()
+
+
+def _handle_new(user_input: str, state: SessionState, config: Config):
+    _finish_chat_history(state)
+    state.history.clear()
+    state.last_query = None
+    state.last_keyword = ""
+    state.last_answer = None
+    _console().print("[yellow]Session reset. Starting fresh.[/yellow]\n")
+
+
+def _handle_retry(user_input: str, state: SessionState, config: Config):
+    if state.last_query is None:
+        _console().print("[red]No previous query to retry.[/red]")
+        return None
+    _console().print(f"[dim]Retrying: {state.last_query}[/dim]")
+    return state.last_query, state.last_keyword
+
+
+def _handle_agent(user_input: str, state: SessionState, config: Config):
+    state.agent_mode = not state.agent_mode
+    mode = "on" if state.agent_mode else "off"
+    color = "magenta" if state.agent_mode else "yellow"
+    _console().print(f"[{color}]Agent mode toggled {mode}.[/{color}]")
+    if state.agent_mode:
+        _console().print("[dim]Your messages will now be handled by the agent. "
+                      "Type /agent again to switch back to search mode.[/dim]")
+        if config.agent.unsafe_mode:
+            _console().print("[red]Warning: Agent unsafe mode is enabled. Be cautious with commands and file actions.[/red]")
+
+
+def _handle_tools(user_input: str, state: SessionState, config: Config):
+    _print_tools_table(config)
+
+
+def _handle_init(user_input: str, state: SessionState, config: Config):
+    from neoflow.init import run_init
+    run_init(_console())
+
+
+def _handle_save(user_input: str, state: SessionState, config: Config):
+    if state.last_answer is None:
+        _console().print("[red]Nothing to save yet.[/red]")
+        return None
+    parts = user_input.split(maxsplit=1)
+    if len(parts) < 2 or not parts[1].strip():
+        _console().print("[red]Usage: /save <filename>[/red]")
+        return None
+    _save_report(state.last_answer, parts[1].strip())
+
+
+# /keyword=VALUE <query> and /t=NAME: command, first argument, remainder.
+_SLASH_RE = re.compile(r"^/(keyword|t)=\s*(\S*)\s*(.*?)\s*$", re.IGNORECASE | re.DOTALL)
+
+
+def _handle_keyword(user_input: str, state: SessionState, config: Config):
+    _, keyword, query = _SLASH_RE.match(user_input).groups()
+    if not keyword or not query:
+        _console().print("[red]Usage: /keyword=PROJECT your search query[/red]")
+        return None
+    _console().print(f"[dim]Keyword: {keyword}[/dim]")
+    return query, keyword
+
+
+def _handle_template(user_input: str, state: SessionState, config: Config):
+    from neoflow.template import TemplateError, load_template, run_template_form
+
+    _, name, rest = _SLASH_RE.match(user_input).groups()
+    template_name = f"{name} {rest}".strip()
+    if not template_name:
+        _console().print("[red]Usage: /t=template_name[/red]")
+        return None
+    try:
+        template = load_template(template_name)
+        query = run_template_form(template, _console())
+    except TemplateError as exc:
+        _console().print(f"[red]{exc}[/red]")
+        return None
+
+    if not query.strip():
+        _console().print("[yellow]Empty query — skipping search.[/yellow]")
+        return None
+
+    _console().print(f"\n[dim]Running query: {query}[/dim]")
+    return query, state.last_keyword
+
+
+_EXACT_COMMANDS = {
+    "/exit": _handle_exit,
+    "/help": _handle_help,
+    "/new": _handle_new,
+    "/retry": _handle_retry,
+    "/agent": _handle_agent,
+    "/tools": _handle_tools,
+    "/init": _handle_init,
+}
+
+# Checked in order after an exact match fails.
+_PREFIX_COMMANDS = (
+    ("/save", _handle_save),
+    ("/keyword=", _handle_keyword),
+    ("/t=", _handle_template),
+)
+_PREFIX_CMDS = tuple(prefix for prefix, _ in _PREFIX_COMMANDS)
+
+
+def _find_slash_handler(lower: str, has_args: bool = False):
+    """Return the handler for the lowercased command token *lower*.
+
+    Exact commands only match when nothing follows them, so ``/exit foo`` is
+    reported as unknown instead of exiting.
+    """
+    if not has_args:
+        handler = _EXACT_COMMANDS.get(lower)
+        if handler is not None:
+            return handler
+    if lower.startswith(_PREFIX_CMDS):
+        for prefix, handler in _PREFIX_COMMANDS:
+            if lower.startswith(prefix):
+                return handler
+    return None
+
+
+def cmd_interactive(args, config: Config):
+    """Run an interactive chat session with slash-command support."""
+    from datetime import datetime
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from neoflow.agent.input import multiline_prompt
+    from neoflow.chat import run_chat
+    from neoflow.status_bar import StatusBar
+
+    _check_services(config)
+    _prewarm_connections(config)
+
+    state = SessionState()
+    # One status bar for the whole session, reset and restarted per query.
+    bar = StatusBar()
+
+    head_section = _build_header(
+        config.llm_provider.ollama_model,
+        config.llm_provider.provider,
+        config.chat.save_history,
+        config.agent.unsafe_mode,
+    )
+    _console().print(head_section)
+    _console().print("Type [bold]/help[/bold] to see available commands.")
+    _console().print("[dim]Multiline: Enter for newline, empty line to submit.[/dim]\n")
 
     while True:
         try:
-            prompt_label = (
-                "<magenta><b>BugSummoner &gt; </b></magenta>"
-                if agent_mode
-                else "<cyan><b>AI_Overlord &gt; </b></cyan>"
-            )
-            user_input = multiline_prompt(prompt_label, is_agent=agent_mode).strip()
+            prompt_label = _PROMPT_AGENT if state.agent_mode else _PROMPT_NORMAL
+            user_input = multiline_prompt(prompt_label, is_agent=state.agent_mode).strip()
         except (KeyboardInterrupt, EOFError):
             break
 
@@ -857,143 +1231,70 @@ Contact:
 
         # --- Slash commands ---
 
-        lower = user_input.lower()
-
-        if lower == "/exit":
-            if history and config.chat.save_history:
-                _save_chat_history(history, config)
-            console.print("[bold]Goodbye![/bold]")
-            break
-
-        if lower == "/help":
-            _print_chat_help()
-            continue
-
-        if lower == "/new":
-            if history and config.chat.save_history:
-                _save_chat_history(history, config)
-            history.clear()
-            last_query = None
-            last_keyword = ""
-            last_answer = None
-            console.print("[yellow]Session reset. Starting fresh.[/yellow]\n")
-            continue
-
-        if lower.startswith("/save"):
-            if last_answer is None:
-                console.print("[red]Nothing to save yet.[/red]")
+        if user_input.startswith("/"):
+            # Only the command token is lowercased, never a pasted query body.
+            head = user_input.split(maxsplit=1)[0]
+            handler = _find_slash_handler(head.lower(), has_args=head != user_input)
+            if handler is None:
+                _console().print(f"[red]Unknown command: {head}[/red]")
+                _console().print("Type [bold]/help[/bold] for available commands.")
                 continue
-            parts = user_input.split(maxsplit=1)
-            if len(parts) < 2 or not parts[1].strip():
-                console.print("[red]Usage: /save <filename>[/red]")
+            search = handler(user_input, state, config)
+            if state.done:
+                break
+            if search is None:
                 continue
-            _save_report(last_answer, parts[1].strip())
-            continue
-
-        if lower == "/retry":
-            if last_query is None:
-                console.print("[red]No previous query to retry.[/red]")
-                continue
-            query = last_query
-            keyword = last_keyword
-            console.print(f"[dim]Retrying: {query}[/dim]")
-        elif lower == "/agent":
-            agent_mode = not agent_mode
-            state = "on" if agent_mode else "off"
-            color = "magenta" if agent_mode else "yellow"
-            console.print(f"[{color}]Agent mode toggled {state}.[/{color}]")
-            if agent_mode:
-                console.print("[dim]Your messages will now be handled by the agent. "
-                              "Type /agent again to switch back to search mode.[/dim]")
-                if config.agent.unsafe_mode:
-                    console.print("[red]Warning: Agent unsafe mode is enabled. Be cautious with commands and file actions.[/red]")
-            continue
-        elif lower.startswith("/keyword="):
-            # Parse /keyword=VALUE <query>
-            after_slash = user_input[len("/keyword="):]
-            parts = after_slash.split(maxsplit=1)
-            if not parts:
-                console.print("[red]Usage: /keyword=PROJECT your search query[/red]")
-                continue
-            keyword = parts[0]
-            if len(parts) < 2 or not parts[1].strip():
-                console.print("[red]Usage: /keyword=PROJECT your search query[/red]")
-                continue
-            query = parts[1].strip()
-            console.print(f"[dim]Keyword: {keyword}[/dim]")
-        elif lower.startswith("/t="):
-            template_name = user_input[len("/t="):].strip()
-            if not template_name:
-                console.print("[red]Usage: /t=template_name[/red]")
-                continue
-            try:
-                template = load_template(template_name)
-                query = run_template_form(template, console)
-            except TemplateError as exc:
-                console.print(f"[red]{exc}[/red]")
-                continue
-
-            if not query.strip():
-                console.print("[yellow]Empty query — skipping search.[/yellow]")
-                continue
-
-            keyword = last_keyword
-            console.print(f"\n[dim]Running query: {query}[/dim]")
-        elif lower == "/tools":
-            _print_tools_table(config)
-            continue
-        elif lower == "/init":
-            from neoflow.init import run_init
-            run_init(console)
-            continue
-        elif user_input.startswith("/"):
-            console.print(f"[red]Unknown command: {user_input.split()[0]}[/red]")
-            console.print("Type [bold]/help[/bold] for available commands.")
-            continue
-        elif agent_mode:
+            query, keyword = search
+        elif state.agent_mode:
             # --- Agent mode: hand the message to the agent loop ---
             from neoflow.agent.agent import run_agent
-            run_agent(user_input, config, console)
+            run_agent(user_input, config, _console())
             continue
         else:
             # Plain query — use last keyword or none
             query = user_input
-            keyword = last_keyword
+            keyword = state.last_keyword
 
         # --- Execute search via tool-based chat ---
-        last_query = query
-        last_keyword = keyword
+        state.last_query = query
+        state.last_keyword = keyword
 
-        bar = StatusBar()
+        bar.reset()
         bar.start()
         try:
-            answer = run_chat(query, config, console, bar)
+            answer = run_chat(query, config, _console(), bar)
         finally:
             bar.stop()
 
         if answer:
-            last_answer = answer
-            history.append({
-                "timestamp": datetime.now().isoformat(),
-                "keyword": keyword,
-                "query": query,
-                "answer": answer,
-            })
-            console.print()
-            console.print(Panel(Markdown(answer), title="Answer", border_style="green"))
-            console.print()
+            state.last_answer = answer
+            turn = ChatTurn(
+                timestamp=datetime.now().isoformat(),
+                keyword=keyword,
+                query=query,
+                answer=answer,
+            )
+            state.history.append(turn)
+            _append_chat_history(turn, state, config)
+            _console().print()
+            _console().print(Panel(Markdown(answer), title="Answer", border_style="green"))
+            _console().print()
+
 
 def _print_tool_pack_metadata(metadata_block: dict):
+    from rich.table import Table
+
     table = Table(title="Tool Pack Metadata", show_header=True, border_style="blue")
     table.add_column("Field", style="bold cyan")
     table.add_column("Value")
     for field in ("name", "tag", "version", "description", "author", "license"):
         table.add_row(field, str(metadata_block.get(field, "")))
-    console.print(table)
+    _console().print(table)
 
 
 def cmd_tool_pack(args, config: Config):
     """Build, install, uninstall, list, or validate tool packs."""
+    from rich.table import Table
 
     if args.tool_command == "new":
         try:
@@ -1003,50 +1304,50 @@ def cmd_tool_pack(args, config: Config):
                 force=args.force,
             )
         except ValueError as exc:
-            console.print(f"[red]{exc}[/red]")
+            _console().print(f"[red]{exc}[/red]")
             sys.exit(1)
         except Exception as exc:
-            console.print(f"[red]Failed to scaffold tool pack: {exc}[/red]")
+            _console().print(f"[red]Failed to scaffold tool pack: {exc}[/red]")
             sys.exit(1)
 
-        console.print("[green]Tool pack scaffold created[/green]")
-        console.print(f"Path: {pack_dir}")
-        console.print(f"Tag: {manifest.get('metadata', {}).get('tag', '')}")
-        console.print("Next: neoflow tool validate <path> && neoflow tool build <path>")
+        _console().print("[green]Tool pack scaffold created[/green]")
+        _console().print(f"Path: {pack_dir}")
+        _console().print(f"Tag: {manifest.get('metadata', {}).get('tag', '')}")
+        _console().print("Next: neoflow tool validate <path> && neoflow tool build <path>")
         return
 
     if args.tool_command == "build":
         source_path = args.source
-        console.print("Checking manifest...")
+        _console().print("Checking manifest...")
         try:
             validation = validate_tool_manifest_from_path(
                 Path(source_path).expanduser().resolve()
             )
         except FileNotFoundError:
-            console.print("[red]Invalid manifest[/red]")
-            console.print("[red]- manifest.json not found[/red]")
+            _console().print("[red]Invalid manifest[/red]")
+            _console().print("[red]- manifest.json not found[/red]")
             sys.exit(1)
         except Exception as exc:
-            console.print(f"[red]{exc}[/red]")
+            _console().print(f"[red]{exc}[/red]")
             sys.exit(1)
 
         if validation.errors:
-            console.print("[red]Invalid manifest[/red]")
+            _console().print("[red]Invalid manifest[/red]")
             for error in validation.errors:
-                console.print(f"[red]- {error}[/red]")
+                _console().print(f"[red]- {error}[/red]")
             sys.exit(1)
 
-        console.print("[green]Manifest is valid![/green]")
-        console.print("Building...")
+        _console().print("[green]Manifest is valid![/green]")
+        _console().print("Building...")
         try:
             package_path, _ = build_tool_pack(source_path, output_dir=args.output)
         except Exception as exc:
-            console.print(f"[red]Build failed: {exc}[/red]")
+            _console().print(f"[red]Build failed: {exc}[/red]")
             sys.exit(1)
 
-        console.print("[green]Build complete[/green]")
-        console.print(f"Package: {package_path.name}")
-        console.print(str(package_path.resolve()))
+        _console().print("[green]Build complete[/green]")
+        _console().print(f"Package: {package_path.name}")
+        _console().print(str(package_path.resolve()))
         return
 
     if args.tool_command == "validate":
@@ -1056,21 +1357,21 @@ def cmd_tool_pack(args, config: Config):
                 Path(source_path).expanduser().resolve()
             )
         except FileNotFoundError:
-            console.print("[red]manifest.json not found[/red]")
+            _console().print("[red]manifest.json not found[/red]")
             sys.exit(1)
         except Exception as exc:
-            console.print(f"[red]{exc}[/red]")
+            _console().print(f"[red]{exc}[/red]")
             sys.exit(1)
 
         if validation.errors:
-            console.print("[red]Manifest is invalid:[/red]")
+            _console().print("[red]Manifest is invalid:[/red]")
             for error in validation.errors:
-                console.print(f"[red]  - {error}[/red]")
+                _console().print(f"[red]  - {error}[/red]")
             sys.exit(1)
 
         _print_tool_pack_metadata(validation.manifest.get("metadata", {}))
         tools_list = validation.manifest.get("tools", [])
-        console.print(f"[green]Manifest is valid[/green] ({len(tools_list)} tool file(s))")
+        _console().print(f"[green]Manifest is valid[/green] ({len(tools_list)} tool file(s))")
         return
 
     if args.tool_command == "install":
@@ -1079,7 +1380,7 @@ def cmd_tool_pack(args, config: Config):
             import tempfile
 
             if not os.path.isfile(args.file):
-                console.print(f"[red bold]File not found: {args.file}[/red bold]")
+                _console().print(f"[red bold]File not found: {args.file}[/red bold]")
                 sys.exit(1)
 
             # Preview manifest before confirming install
@@ -1088,40 +1389,40 @@ def cmd_tool_pack(args, config: Config):
                     archive.extractall(temp_dir)
                 candidates = list(Path(temp_dir).rglob("manifest.json"))
                 if len(candidates) != 1:
-                    console.print("[red]Invalid package: no manifest.json found[/red]")
+                    _console().print("[red]Invalid package: no manifest.json found[/red]")
                     sys.exit(1)
                 validation = validate_tool_manifest_from_path(candidates[0].parent)
 
             if validation.errors:
-                console.print("[red]Invalid package manifest:[/red]")
+                _console().print("[red]Invalid package manifest:[/red]")
                 for error in validation.errors:
-                    console.print(f"[red]  - {error}[/red]")
+                    _console().print(f"[red]  - {error}[/red]")
                 sys.exit(1)
 
         except Exception as exc:
-            console.print(f"[red]Cannot read package: {exc}[/red]")
+            _console().print(f"[red]Cannot read package: {exc}[/red]")
             sys.exit(1)
 
         _print_tool_pack_metadata(validation.manifest.get("metadata", {}))
         if not _confirm_modal("Install this tool pack?", default=False, title="Install Tool Pack"):
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
 
-        with console.status("[bold green]Installing tool pack...[/bold green]"):
+        with _console().status("[bold green]Installing tool pack...[/bold green]"):
             try:
                 entry = install_tool_pack(args.file, config)
             except ValueError as exc:
                 msg = str(exc)
                 if "already installed" in msg:
-                    console.print(f"[yellow]{msg}[/yellow]")
+                    _console().print(f"[yellow]{msg}[/yellow]")
                     return
-                console.print(f"[red]Cannot install: {msg}[/red]")
+                _console().print(f"[red]Cannot install: {msg}[/red]")
                 sys.exit(1)
             except Exception as exc:
-                console.print(f"[red]Cannot install: {exc}[/red]")
+                _console().print(f"[red]Cannot install: {exc}[/red]")
                 sys.exit(1)
 
-        console.print(f"[green]Tool pack installed: {entry['name']} ({entry['tag']})[/green]")
+        _console().print(f"[green]Tool pack installed: {entry['name']} ({entry['tag']})[/green]")
         return
 
     if args.tool_command == "uninstall":
@@ -1131,30 +1432,30 @@ def cmd_tool_pack(args, config: Config):
             None,
         )
         if not entry:
-            console.print(f"[red]Tool pack not found: {args.tag}[/red]")
+            _console().print(f"[red]Tool pack not found: {args.tag}[/red]")
             sys.exit(1)
 
         _print_tool_pack_metadata(entry)
         if not _confirm_modal(
             "Uninstall this tool pack?", default=False, title="Uninstall Tool Pack"
         ):
-            console.print("[yellow]Operation cancelled.[/yellow]")
+            _console().print("[yellow]Operation cancelled.[/yellow]")
             return
 
-        with console.status("[bold green]Uninstalling tool pack...[/bold green]"):
+        with _console().status("[bold green]Uninstalling tool pack...[/bold green]"):
             try:
                 uninstall_tool_pack(args.tag)
             except Exception as exc:
-                console.print(f"[red]Cannot uninstall: {exc}[/red]")
+                _console().print(f"[red]Cannot uninstall: {exc}[/red]")
                 sys.exit(1)
 
-        console.print(f"[green]Tool pack removed: {args.tag}[/green]")
+        _console().print(f"[green]Tool pack removed: {args.tag}[/green]")
         return
 
     if args.tool_command == "list":
         packs = list_tool_packs()
         if not packs:
-            console.print("No tool packs installed.")
+            _console().print("No tool packs installed.")
             return
 
         table = Table(title="Installed Tool Packs", show_header=True, border_style="blue")
@@ -1169,31 +1470,14 @@ def cmd_tool_pack(args, config: Config):
                 str(item.get("version", "")),
                 str(item.get("description", "")),
             )
-        console.print(table)
+        _console().print(table)
         return
 
-    console.print("[red]Please specify a subcommand. Use: neoflow tool --help[/red]")
+    _console().print("[red]Please specify a subcommand. Use: neoflow tool --help[/red]")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="neoflow",
-        description="AI-powered search and analysis tool using LLM",
-    )
-    parser.add_argument(
-        "-v", "--verbose", action="store_true", help="Enable debug logging"
-    )
-    parser.add_argument(
-        "-i", "--info", action="store_true", help="Enable info logging"
-    )
-    parser.add_argument(
-        "--provider", type=str, choices=["auto", "openai", "vllm", "ollama"],
-        help="LLM provider to use (default: auto-detect)",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # agent
+def _build_agent_parser(subparsers):
+    """Register the ``agent`` subcommand."""
     agent_parser = subparsers.add_parser("agent", help="Execute an autonomous task with planning and tool usage")
     agent_parser.add_argument("task", type=str, help="Task description")
     agent_parser.add_argument(
@@ -1209,13 +1493,17 @@ def main():
         help="Set working directory for file and command actions",
     )
 
-    # search
+
+def _build_search_parser(subparsers):
+    """Register the ``search`` subcommand."""
     search_parser = subparsers.add_parser("search", help="Search tickets (single query)")
     search_parser.add_argument("-q", "--query", type=str, help="Search query")
     search_parser.add_argument("-p", "--project", type=str, help="Project name filter")
     search_parser.add_argument("-o", "--output", type=str, help="Save result to this filename")
 
-    # import
+
+def _build_import_parser(subparsers):
+    """Register the ``import`` subcommand."""
     import_parser = subparsers.add_parser(
         "import",
         help="Import tickets, docs, zip code, or source folder code into Weaviate",
@@ -1242,6 +1530,9 @@ def main():
         help="Repository name label (required with --zip or --source)",
     )
 
+
+def _build_knowledge_pack_parser(subparsers):
+    """Register the ``knowledge-pack`` subcommand."""
     knowledge_pack_parser = subparsers.add_parser(
         "knowledge-pack",
         help="Build, install, uninstall, and list knowledge packs",
@@ -1266,22 +1557,30 @@ def main():
         help="Keep copied domain files when uninstalling",
     )
 
-    # tool pack
+
+def _build_tool_parser(subparsers):
+    """Register the ``tool`` subcommand and its operations."""
     tool_parser = subparsers.add_parser(
         "tool",
         help="Build, install, uninstall, list, and validate tool packs (.ntp)",
     )
     tool_subparsers = tool_parser.add_subparsers(dest="tool_command", help="Tool pack operations")
 
-    tool_build_parser = tool_subparsers.add_parser("build", help="Build a .ntp tool pack")
-    tool_build_parser.add_argument("source", help="Path to directory containing manifest.json")
+    # Shared by the tool subcommands that operate on a pack source directory
+    tool_source_parent = argparse.ArgumentParser(add_help=False)
+    tool_source_parent.add_argument("source", help="Path to directory containing manifest.json")
+
+    tool_build_parser = tool_subparsers.add_parser(
+        "build", parents=[tool_source_parent], help="Build a .ntp tool pack",
+    )
     tool_build_parser.add_argument(
         "-o", "--output", type=str, default=None,
         help="Output directory for the .ntp file (default: current directory)",
     )
 
-    tool_validate_parser = tool_subparsers.add_parser("validate", help="Validate a tool pack source directory")
-    tool_validate_parser.add_argument("source", help="Path to directory containing manifest.json")
+    tool_subparsers.add_parser(
+        "validate", parents=[tool_source_parent], help="Validate a tool pack source directory",
+    )
 
     tool_install_parser = tool_subparsers.add_parser("install", help="Install a .ntp tool pack")
     tool_install_parser.add_argument("file", help="Path to the .ntp file to install")
@@ -1305,7 +1604,9 @@ def main():
         help="Overwrite target directory if it already exists",
     )
 
-    # config
+
+def _build_config_parser(subparsers):
+    """Register the ``config`` subcommand."""
     config_parser = subparsers.add_parser("config", help="Generate .env configuration template")
     config_parser.add_argument(
         "-o", "--output", type=str, default=".env",
@@ -1316,7 +1617,9 @@ def main():
         help="Overwrite existing file without confirmation",
     )
 
-    # db
+
+def _build_db_parser(subparsers):
+    """Register the ``db`` subcommand and its operations."""
     db_parser = subparsers.add_parser("db", help="Database management commands")
     db_parser.add_argument(
         "--collection",
@@ -1342,7 +1645,9 @@ def main():
         help="List available Weaviate collections",
     )
 
-    # server
+
+def _build_server_parser(subparsers):
+    """Register the ``server`` subcommand."""
     server_parser = subparsers.add_parser(
         "server",
         help="Start REST API server, MCP server, or MCP proxy",
@@ -1385,6 +1690,137 @@ def main():
         help="Authentication token for remote server (optional)",
     )
 
+
+_SUBPARSER_BUILDERS = {
+    "agent": _build_agent_parser,
+    "search": _build_search_parser,
+    "import": _build_import_parser,
+    "knowledge-pack": _build_knowledge_pack_parser,
+    "tool": _build_tool_parser,
+    "config": _build_config_parser,
+    "db": _build_db_parser,
+    "server": _build_server_parser,
+}
+
+# Subcommand name -> handler.
+_COMMANDS = MappingProxyType({
+    "agent": cmd_agent,
+    "search": cmd_search,
+    "import": cmd_import,
+    "knowledge-pack": cmd_knowledge_pack,
+    "tool": cmd_tool_pack,
+    "config": cmd_config,
+    "db": cmd_db,
+    "server": cmd_server,
+    "serve": cmd_server,
+    "mcp-server": cmd_server,
+    "mcp-proxy": cmd_server,
+})
+
+# Root options that consume the following token as their value.
+_ROOT_OPTIONS_WITH_VALUE = ("--provider",)
+
+
+def _subparsers_to_build(argv: list[str]) -> tuple[str, ...]:
+    """Return the names of the subparsers that parsing *argv* needs.
+
+    Only the named subcommand is built when one is given, and none when
+    the interactive session is started. Top-level help and unknown commands
+    get every subparser so argparse can list all choices.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("-h", "--help"):
+            return tuple(_SUBPARSER_BUILDERS)
+        if token in _ROOT_OPTIONS_WITH_VALUE:
+            next(tokens, None)
+            continue
+        if token.startswith("-"):
+            continue
+        if token in _SUBPARSER_BUILDERS:
+            return (token,)
+        return tuple(_SUBPARSER_BUILDERS)
+    return ()
+
+
+_ENV_INLINE_COMMENT = re.compile(r"\s+#")
+
+
+def _parse_env_file(path: str) -> dict[str, str] | None:
+    """Parse a plain ``KEY=VALUE`` .env file.
+
+    Handles comments, blank lines, surrounding whitespace and single-line
+    quoted values. Returns None when the file uses anything more involved
+    (``export``, ``$`` interpolation, escapes, multiline values) so the
+    caller can defer to python-dotenv.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if "$" in text or "\\" in text:
+        return None
+
+    values: dict[str, str] = {}
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key or key.startswith("export "):
+            return None
+        value = value.strip()
+        if value[:1] in ("'", '"'):
+            end = value.find(value[0], 1)
+            if end == -1:
+                return None
+            value = value[1:end]
+        else:
+            value = _ENV_INLINE_COMMENT.split(value, maxsplit=1)[0]
+        values[key] = value
+    return values
+
+
+def _load_env_file(path: str, override: bool = False) -> None:
+    """Load a .env file into ``os.environ``, like ``dotenv.load_dotenv``."""
+    values = _parse_env_file(path)
+    if values is None:
+        from dotenv import load_dotenv
+
+        load_dotenv(path, override=override)
+        return
+    for key, value in values.items():
+        if override or key not in os.environ:
+            os.environ[key] = value
+
+
+def main():
+    # Answer a bare version query before any parser or config work.
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(f"neoflow {_neoflow_version()}")
+        return
+
+    parser = argparse.ArgumentParser(
+        prog="neoflow",
+        description="AI-powered search and analysis tool using LLM",
+    )
+    parser.add_argument(
+        "-V", "--version", action=_VersionAction,
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable debug logging"
+    )
+    parser.add_argument(
+        "-i", "--info", action="store_true", help="Enable info logging"
+    )
+    parser.add_argument(
+        "--provider", type=str, choices=["auto", "openai", "vllm", "ollama"],
+        help="LLM provider to use (default: auto-detect)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    # Build only the subparsers this invocation can reach.
+    for name in _subparsers_to_build(sys.argv[1:]):
+        _SUBPARSER_BUILDERS[name](subparsers)
+
     args = parser.parse_args()
     
     # For MCP server with stdio transport, we need to redirect all logging to stderr
@@ -1400,23 +1836,29 @@ def main():
 
     user_config_override = str(bootstrap_user_resource_folders())
 
-    # Load .env if available
-    from dotenv import load_dotenv
-
-    if user_config_override:
-        env_path = os.path.join(user_config_override, ".env")
-        if os.path.isfile(env_path):
+    # Load .env files if available. A .env in the working directory
+    # overrides the user-level one.
+    user_env = os.path.join(user_config_override, ".env")
+    for env_path in (user_env, ".env"):
+        if not os.path.isfile(env_path):
+            continue
+        if env_path == user_env:
             # Use stderr for MCP stdio mode to avoid interfering with JSON-RPC
-            output_console = Console(stderr=True) if stderr_logging else console
+            output_console = _console(stderr_logging)
             output_console.print(f"[green]Loading configuration from {env_path}[/green]")
-            load_dotenv(env_path)
-    
-    load_dotenv(override=True)
-    config = Config.from_env()
+        _load_env_file(env_path, override=(env_path == ".env"))
 
-    # Apply CLI provider override
+    # Apply the CLI provider override through the environment so the config
+    # is built with it and get_provider() callers see the same choice.
     if args.provider:
-        config.llm_provider.provider = args.provider
+        os.environ["LLM_PROVIDER"] = args.provider
+
+    try:
+        config = get_config()
+    except ConfigError as e:
+        _console(True).print("[red bold]Invalid configuration:[/red bold]")
+        _console(True).print(str(e), markup=False)
+        sys.exit(1)
 
     # Instantiate LLM provider instance
     from neoflow.llm_provider import OpenAIProvider, OllamaProvider, VLLMProvider
@@ -1439,21 +1881,8 @@ def main():
             endpoint=config.llm_provider.ollama_api_url
         )
     
-    commands = {
-        "agent": cmd_agent,
-        "search": cmd_search,
-        "import": cmd_import,
-        "knowledge-pack": cmd_knowledge_pack,
-        "tool": cmd_tool_pack,
-        "config": cmd_config,
-        "db": cmd_db,
-        "server": cmd_server,
-        "serve": cmd_server,
-        "mcp-server": cmd_server,
-        "mcp-proxy": cmd_server,
-    }
-
-    if args.command in commands:
+    handler = _COMMANDS.get(args.command)
+    if handler is not None:
         if args.command == "knowledge-pack":
             if args.build and not args.target:
                 parser.error("knowledge-pack --build requires <path/to/content>")
@@ -1471,7 +1900,7 @@ def main():
             and getattr(args, "collection", None) is None
         ):
             parser.error("db requires a subcommand (e.g., 'clear')")
-        commands[args.command](args, config)
+        handler(args, config)
     else:
         # No command specified - default to interactive mode
         cmd_interactive(args, config)
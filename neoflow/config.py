@@ -1,8 +1,18 @@
+import functools
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from importlib import resources
+from typing import Any
 
+ENV_TEMPLATE_FILE = "env.template"
 
-@dataclass
+
+class ConfigError(ValueError):
+    """Raised when environment variables hold values that cannot be parsed."""
+
+
+@dataclass(frozen=True, slots=True)
 class WeaviateConfig:
     host: str = "localhost"
     port: int = 8080
@@ -15,7 +25,7 @@ class WeaviateConfig:
     timeout_insert: int = 120
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImporterConfig:
     tickets_dir: str = "tickets"
     batch_size: int = 300
@@ -23,7 +33,7 @@ class ImporterConfig:
     max_file_size_bytes: int = 1_000_000  # 1MB
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     context_token_threshold: int =29_000
     large_message_ratio: float = 0.90
@@ -46,14 +56,14 @@ class AgentConfig:
     planning_context_max_lines: int = 2000       # Total-line pool shared across all context files
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatConfig:
     save_history: bool = True
     history_dir: str = "chat_history"
     max_iterations: int = 25
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMProviderConfig:
     """Unified configuration for LLM and Weaviate providers.
     
@@ -72,19 +82,18 @@ class LLMProviderConfig:
     chunk_size_bytes: int = 2_000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     host: str = "localhost"
     port: int = 9720
-    cors_origins: list[str] = field(default_factory=lambda: ["*"])
+    cors_origins: tuple[str, ...] = ("*",)
     session_ttl_minutes: int = 60
     max_sessions: int = 100
     enforce_system_prompt: bool = True
     api_key: str = ""
-    api_key: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPConfig:
     """Configuration for Model Context Protocol (MCP) server."""
     enabled: bool = True
@@ -97,14 +106,113 @@ class MCPConfig:
     auth_token: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolConfig:
     """Configuration for the tool pack system."""
 
     allow_unsafe_tool_packs: bool = False  # Set True to allow installing 'unsafe'-level tools
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class CLIConfig:
+    """Configuration for the command-line entry point."""
+
+    skip_healthcheck: bool = False  # Skip the Weaviate/Ollama startup probes
+
+
+@functools.lru_cache(maxsize=1)
+def _weaviate_config_classes():
+    """Import weaviate's Configure/GenerativeConfig once, on first use."""
+    from weaviate.classes.config import Configure, GenerativeConfig
+
+    return Configure, GenerativeConfig
+
+
+_BOOL_TRUE: frozenset[str] = frozenset({"true", "1", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _BOOL_TRUE
+
+
+def _parse_keyword(value: str) -> str:
+    # Small closed vocabularies (provider, transport) are compared against
+    # literals downstream; interning makes those comparisons identity hits.
+    return sys.intern(value.strip())
+
+
+_PROVIDERS = frozenset({"auto", "openai", "ollama", "vllm"})
+
+
+def _parse_provider(value: str) -> str:
+    provider = _parse_keyword(value.lower())
+    if provider not in _PROVIDERS:
+        raise ValueError(
+            f"Unknown provider: {provider}. Must be 'openai', 'ollama', 'vllm', or 'auto'"
+        )
+    return provider
+
+
+# (section.attribute, environment variable, parser). Unset variables keep the
+# dataclass default, so every entry here must agree with that default.
+_ENV_SPEC = (
+    ("weaviate.host", "WEAVIATE_HOST", str),
+    ("weaviate.port", "WEAVIATE_PORT", int),
+    ("weaviate.grpc_host", "WEAVIATE_GRPC_HOST", str),
+    ("weaviate.grpc_port", "WEAVIATE_GRPC_PORT", int),
+    ("weaviate.http_secure", "WEAVIATE_HTTP_SECURE", _parse_bool),
+    ("weaviate.grpc_secure", "WEAVIATE_GRPC_SECURE", _parse_bool),
+    ("importer.max_file_size_bytes", "IMPORTER_MAX_FILE_SIZE_BYTES", int),
+    ("agent.context_token_threshold", "AGENT_CONTEXT_TOKEN_THRESHOLD", int),
+    ("agent.large_message_ratio", "AGENT_LARGE_MESSAGE_RATIO", float),
+    ("agent.planning_enabled", "AGENT_PLANNING_ENABLED", _parse_bool),
+    ("agent.max_iterations", "AGENT_MAX_ITERATIONS", int),
+    ("agent.loop_detection_enabled", "AGENT_LOOP_DETECTION_ENABLED", _parse_bool),
+    ("agent.loop_action_window_size", "AGENT_LOOP_ACTION_WINDOW_SIZE", int),
+    ("agent.loop_repetition_threshold", "AGENT_LOOP_REPETITION_THRESHOLD", int),
+    ("agent.loop_error_threshold", "AGENT_LOOP_ERROR_THRESHOLD", int),
+    ("agent.loop_pattern_length", "AGENT_LOOP_PATTERN_LENGTH", int),
+    ("agent.compression_enabled", "AGENT_COMPRESSION_ENABLED", _parse_bool),
+    ("agent.compression_min_tokens", "AGENT_COMPRESSION_MIN_TOKENS", int),
+    ("agent.compression_min_chars", "AGENT_COMPRESSION_MIN_CHARS", int),
+    ("agent.unsafe_mode", "AGENT_UNSAFE_MODE", _parse_bool),
+    ("agent.planning_context_max_files", "AGENT_PLANNING_CONTEXT_MAX_FILES", int),
+    ("agent.planning_context_max_lines", "AGENT_PLANNING_CONTEXT_MAX_LINES", int),
+    ("chat.save_history", "CHAT_SAVE_HISTORY", _parse_bool),
+    ("chat.history_dir", "CHAT_HISTORY_DIR", str),
+    ("chat.max_iterations", "CHAT_MAX_ITERATIONS", int),
+    ("server.host", "SERVER_HOST", str),
+    ("server.port", "SERVER_PORT", int),
+    ("server.enforce_system_prompt", "SERVER_ENFORCE_SYSTEM_PROMPT", _parse_bool),
+    ("server.api_key", "SERVER_API_KEY", str),
+    ("mcp.enabled", "MCP_ENABLED", _parse_bool),
+    ("mcp.transport", "MCP_TRANSPORT", _parse_keyword),
+    ("mcp.sse_host", "MCP_SSE_HOST", str),
+    ("mcp.sse_port", "MCP_SSE_PORT", int),
+    ("mcp.timeout_seconds", "MCP_TIMEOUT_SECONDS", int),
+    ("mcp.auth_required", "MCP_AUTH_REQUIRED", _parse_bool),
+    ("mcp.auth_token", "MCP_AUTH_TOKEN", str),
+    ("llm_provider.provider", "LLM_PROVIDER", _parse_provider),
+    ("llm_provider.openai_api_key", "OPENAI_API_KEY", str),
+    ("llm_provider.openai_api_base", "OPENAI_API_BASE", str),
+    ("llm_provider.openai_model", "OPENAI_MODEL", str),
+    ("llm_provider.vllm_api_url", "VLLM_API_URL", str),
+    ("llm_provider.vllm_model", "VLLM_MODEL", str),
+    ("llm_provider.ollama_api_url", "OLLAMA_API_URL", str),
+    ("llm_provider.ollama_model", "OLLAMA_MODEL", str),
+    ("llm_provider.embedding_model", "EMBEDDING_MODEL", str),
+    ("llm_provider.chunk_size_bytes", "CHUNK_SIZE_BYTES", int),
+    ("tool.allow_unsafe_tool_packs", "AGENT_ALLOW_UNSAFE_TOOL_PACKS", _parse_bool),
+    ("cli.skip_healthcheck", "NEOFLOW_SKIP_HEALTHCHECK", _parse_bool),
+)
+
+# _ENV_SPEC with the attribute paths pre-split into (section, attribute).
+_ENV_FIELDS = tuple(
+    (*path.split("."), env_name, parse) for path, env_name, parse in _ENV_SPEC
+)
+
+
+@dataclass(slots=True)
 class Config:
     weaviate: WeaviateConfig = field(default_factory=WeaviateConfig)
     importer: ImporterConfig = field(default_factory=ImporterConfig)
@@ -114,234 +222,37 @@ class Config:
     mcp: MCPConfig = field(default_factory=MCPConfig)
     llm_provider: LLMProviderConfig = field(default_factory=LLMProviderConfig)
     tool: ToolConfig = field(default_factory=ToolConfig)
+    cli: CLIConfig = field(default_factory=CLIConfig)
     reports_dir: str = "reports"
+    # Runtime handles attached by the CLI and agent once the config is built.
+    llm_provider_instance: Any = field(default=None, repr=False, compare=False)
+    weaviate_client_instance: Any = field(default=None, repr=False, compare=False)
 
     @classmethod
     def generate_env_template(cls) -> str:
         """Generate a complete .env template with all configuration options."""
-        return """# ===================================================================
-# NeoFlow Configuration Template
-# ===================================================================
-#
-# Copy this file to .env and edit values as needed.
-# Values shown here are the application defaults.
-
-# -----------------------
-# Weaviate Configuration
-# -----------------------
-WEAVIATE_HOST=localhost
-WEAVIATE_PORT=8080
-WEAVIATE_GRPC_HOST=
-WEAVIATE_GRPC_PORT=50051
-WEAVIATE_HTTP_SECURE=false
-WEAVIATE_GRPC_SECURE=false
-
-# -----------------------
-# Importer Configuration
-# -----------------------
-IMPORTER_TICKETS_DIR=tickets
-IMPORTER_BATCH_SIZE=300
-IMPORTER_MAX_WORKERS=20
-IMPORTER_MAX_FILE_SIZE_BYTES=1000000
-
-# -----------------------
-# Agent Configuration
-# -----------------------
-AGENT_CONTEXT_TOKEN_THRESHOLD=29000
-AGENT_LARGE_MESSAGE_RATIO=0.90
-AGENT_PLANNING_ENABLED=true
-AGENT_MAX_ITERATIONS=200
-AGENT_LOOP_DETECTION_ENABLED=true
-AGENT_LOOP_ACTION_WINDOW_SIZE=20
-AGENT_LOOP_REPETITION_THRESHOLD=8
-AGENT_LOOP_ERROR_THRESHOLD=8
-AGENT_LOOP_PATTERN_LENGTH=10
-AGENT_COMPRESSION_ENABLED=true
-AGENT_COMPRESSION_MIN_TOKENS=1000
-AGENT_COMPRESSION_MIN_CHARS=5000
-AGENT_UNSAFE_MODE=false
-AGENT_PLANNING_CONTEXT_MAX_FILES=5
-AGENT_PLANNING_CONTEXT_MAX_LINES=2000
-
-# -----------------------
-# Chat Configuration
-# -----------------------
-CHAT_SAVE_HISTORY=true
-CHAT_HISTORY_DIR=chat_history
-CHAT_MAX_ITERATIONS=25
-
-# -----------------------
-# REST Server Configuration
-# -----------------------
-SERVER_HOST=localhost
-SERVER_PORT=9720
-SERVER_ENFORCE_SYSTEM_PROMPT=true
-SERVER_API_KEY=
-
-# -----------------------
-# MCP Server Configuration
-# -----------------------
-MCP_ENABLED=true
-MCP_TRANSPORT=stdio
-MCP_SSE_HOST=localhost
-MCP_SSE_PORT=9721
-MCP_TIMEOUT_SECONDS=30
-MCP_AUTH_REQUIRED=false
-MCP_AUTH_TOKEN=
-
-# -----------------------
-# LLM Provider Configuration
-# -----------------------
-LLM_PROVIDER=auto
-
-# OpenAI provider
-OPENAI_API_KEY=
-OPENAI_API_BASE=
-OPENAI_MODEL=gpt-4o-mini
-
-# vLLM provider
-VLLM_API_URL=http://vllm:8000
-VLLM_MODEL=meta-llama/Llama-2-13b-chat-hf
-
-# Ollama provider
-OLLAMA_API_URL=http://ollama:11434
-OLLAMA_MODEL=glm-4.7-flash
-EMBEDDING_MODEL=nomic-embed-text
-
-# Common provider tuning
-CHUNK_SIZE_BYTES=2000
-"""
+        return resources.files("neoflow").joinpath(ENV_TEMPLATE_FILE).read_text(encoding="utf-8")
 
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration with environment variable overrides."""
-        config = cls()
-        config.weaviate.host = os.getenv("WEAVIATE_HOST", config.weaviate.host)
-        config.weaviate.port = int(os.getenv("WEAVIATE_PORT", config.weaviate.port))
-        config.weaviate.grpc_host = os.getenv("WEAVIATE_GRPC_HOST", config.weaviate.grpc_host)
-        config.weaviate.grpc_port = int(os.getenv("WEAVIATE_GRPC_PORT", config.weaviate.grpc_port))
-        config.weaviate.http_secure = os.getenv(
-            "WEAVIATE_HTTP_SECURE", str(config.weaviate.http_secure)
-        ).lower() in ("true", "1", "yes")
-        config.weaviate.grpc_secure = os.getenv(
-            "WEAVIATE_GRPC_SECURE", str(config.weaviate.grpc_secure)
-        ).lower() in ("true", "1", "yes")
-        config.importer.max_file_size_bytes = int(os.getenv(
-            "IMPORTER_MAX_FILE_SIZE_BYTES", config.importer.max_file_size_bytes
-        ))
-        config.agent.context_token_threshold = int(os.getenv(
-            "AGENT_CONTEXT_TOKEN_THRESHOLD",
-            config.agent.context_token_threshold,
-        ))
-        config.agent.large_message_ratio = float(os.getenv(
-            "AGENT_LARGE_MESSAGE_RATIO",
-            config.agent.large_message_ratio,
-        ))
-        config.agent.planning_enabled = os.getenv(
-            "AGENT_PLANNING_ENABLED", "true"
-        ).lower() in ("true", "1", "yes")
-        config.agent.max_iterations = int(os.getenv(
-            "AGENT_MAX_ITERATIONS", config.agent.max_iterations
-        ))
-        config.agent.loop_detection_enabled = os.getenv(
-            "AGENT_LOOP_DETECTION_ENABLED", "true"
-        ).lower() in ("true", "1", "yes")
-        config.agent.loop_action_window_size = int(os.getenv(
-            "AGENT_LOOP_ACTION_WINDOW_SIZE", config.agent.loop_action_window_size
-        ))
-        config.agent.loop_repetition_threshold = int(os.getenv(
-            "AGENT_LOOP_REPETITION_THRESHOLD", config.agent.loop_repetition_threshold
-        ))
-        config.agent.loop_error_threshold = int(os.getenv(
-            "AGENT_LOOP_ERROR_THRESHOLD", config.agent.loop_error_threshold
-        ))
-        config.agent.loop_pattern_length = int(os.getenv(
-            "AGENT_LOOP_PATTERN_LENGTH", config.agent.loop_pattern_length
-        ))
-        config.agent.compression_enabled = os.getenv(
-            "AGENT_COMPRESSION_ENABLED", "true"
-        ).lower() in ("true", "1", "yes")
-        config.agent.compression_min_tokens = int(os.getenv(
-            "AGENT_COMPRESSION_MIN_TOKENS", config.agent.compression_min_tokens
-        ))
-        config.agent.compression_min_chars = int(os.getenv(
-            "AGENT_COMPRESSION_MIN_CHARS", config.agent.compression_min_chars
-        ))
-        config.agent.unsafe_mode = os.getenv(
-            "AGENT_UNSAFE_MODE", "false"
-        ).lower() in ("true", "1", "yes")
-        config.agent.planning_context_max_files = int(os.getenv(
-            "AGENT_PLANNING_CONTEXT_MAX_FILES", config.agent.planning_context_max_files
-        ))
-        config.agent.planning_context_max_lines = int(os.getenv(
-            "AGENT_PLANNING_CONTEXT_MAX_LINES", config.agent.planning_context_max_lines
-        ))
-        config.chat.save_history = os.getenv(
-            "CHAT_SAVE_HISTORY", "true"
-        ).lower() in ("true", "1", "yes")
-        config.chat.history_dir = os.getenv(
-            "CHAT_HISTORY_DIR", config.chat.history_dir
-        )
-        config.chat.max_iterations = int(os.getenv(
-            "CHAT_MAX_ITERATIONS", config.chat.max_iterations
-        ))
-        config.server.host = os.getenv("SERVER_HOST", config.server.host)
-        config.server.port = int(os.getenv("SERVER_PORT", config.server.port))
-        config.server.enforce_system_prompt = os.getenv(
-            "SERVER_ENFORCE_SYSTEM_PROMPT", "true"
-        ).lower() in ("true", "1", "yes")
-        config.server.api_key = os.getenv("SERVER_API_KEY", "")
-
-        # MCP configuration
-        config.mcp.enabled = os.getenv(
-            "MCP_ENABLED", "true"
-        ).lower() in ("true", "1", "yes")
-        config.mcp.transport = os.getenv("MCP_TRANSPORT", config.mcp.transport)
-        config.mcp.sse_host = os.getenv("MCP_SSE_HOST", config.mcp.sse_host)
-        config.mcp.sse_port = int(os.getenv("MCP_SSE_PORT", config.mcp.sse_port))
-        config.mcp.timeout_seconds = int(os.getenv(
-            "MCP_TIMEOUT_SECONDS", config.mcp.timeout_seconds
-        ))
-        config.mcp.auth_required = os.getenv(
-            "MCP_AUTH_REQUIRED", "false"
-        ).lower() in ("true", "1", "yes")
-        config.mcp.auth_token = os.getenv("MCP_AUTH_TOKEN", config.mcp.auth_token)
-        
-        # LLM Provider configuration
-        config.llm_provider.provider = os.getenv(
-            "LLM_PROVIDER", config.llm_provider.provider
-        )
-        config.llm_provider.openai_api_key = os.getenv(
-            "OPENAI_API_KEY", config.llm_provider.openai_api_key
-        )
-        config.llm_provider.openai_api_base = os.getenv(
-            "OPENAI_API_BASE", config.llm_provider.openai_api_base
-        )
-        config.llm_provider.openai_model = os.getenv(
-            "OPENAI_MODEL", config.llm_provider.openai_model
-        )
-        config.llm_provider.vllm_api_url = os.getenv(
-            "VLLM_API_URL", config.llm_provider.vllm_api_url
-        )
-        config.llm_provider.vllm_model = os.getenv(
-            "VLLM_MODEL", config.llm_provider.vllm_model
-        )
-        config.llm_provider.ollama_api_url = os.getenv(
-            "OLLAMA_API_URL", config.llm_provider.ollama_api_url
-        )
-        config.llm_provider.ollama_model = os.getenv(
-            "OLLAMA_MODEL", config.llm_provider.ollama_model
-        )
-        config.llm_provider.embedding_model = os.getenv(
-            "EMBEDDING_MODEL", config.llm_provider.embedding_model
-        )
-        config.llm_provider.chunk_size_bytes = int(os.getenv(
-            "CHUNK_SIZE_BYTES", config.llm_provider.chunk_size_bytes
-        ))
-        config.tool.allow_unsafe_tool_packs = os.getenv(
-            "AGENT_ALLOW_UNSAFE_TOOL_PACKS", "false"
-        ).lower() in ("true", "1", "yes")
-        return config
+        get = os.environ.get
+        overrides: dict[str, dict] = {}
+        section_overrides = overrides.setdefault
+        errors: list[str] = []
+        for section, attr, env_name, parse in _ENV_FIELDS:
+            if (value := get(env_name)) is not None:
+                try:
+                    section_overrides(section, {})[attr] = parse(value)
+                except (TypeError, ValueError) as e:
+                    errors.append(f"{env_name}={value!r}: {e}")
+        if errors:
+            raise ConfigError("\n".join(errors))
+        factories = {f.name: f.default_factory for f in fields(cls)}
+        return cls(**{
+            section: factories[section](**values)
+            for section, values in overrides.items()
+        })
 
     def get_active_model_name(self) -> str:
         """Return the active model name based on the configured provider.
@@ -367,89 +278,125 @@ CHUNK_SIZE_BYTES=2000
         
         Raises ValueError if provider is not explicitly configured.
         """
-        from weaviate.classes.config import Configure
-        
-        provider = self.llm_provider.provider.lower()
-        
-        if provider == "openai":
-            if not self.llm_provider.openai_api_key:
-                raise ValueError("OpenAI provider selected but OPENAI_API_KEY is not set")
-            return Configure.Vectors.text2vec_openai(
-                api_key=self.llm_provider.openai_api_key,
-                base_url=self.llm_provider.openai_api_base if self.llm_provider.openai_api_base else None,
-            )
-        
-        elif provider == "ollama":
-            return Configure.Vectors.text2vec_ollama(
-                api_endpoint=self.llm_provider.ollama_api_url,
-                model=self.llm_provider.embedding_model,
-            )
-        
-        elif provider == "vllm":
-            return Configure.Vectors.text2vec_ollama(
-                api_endpoint=self.llm_provider.vllm_api_url,
-                model=self.llm_provider.embedding_model,
-            )
-        
-        elif provider == "auto":
-            # Auto mode: OpenAI if API key is configured, otherwise error
-            if self.llm_provider.openai_api_key:
-                return Configure.Vectors.text2vec_openai(
-                    api_key=self.llm_provider.openai_api_key,
-                    base_url=self.llm_provider.openai_api_base if self.llm_provider.openai_api_base else None,
-                )
-            else:
-                raise ValueError(
-                    "Provider set to 'auto' but no OPENAI_API_KEY configured. "
-                    "Set LLM_PROVIDER explicitly or provide OPENAI_API_KEY"
-                )
-        
-        else:
-            raise ValueError(f"Unknown provider: {provider}. Must be 'openai', 'ollama', 'vllm', or 'auto'")
+        return _resolve_builder("vector", self.llm_provider)()
 
     def get_weaviate_generative_config(self):
         """Get Weaviate generative model config based on selected provider.
         
         Raises ValueError if provider is not explicitly configured.
         """
-        from weaviate.classes.config import GenerativeConfig
-        
-        provider = self.llm_provider.provider.lower()
-        
-        if provider == "openai":
-            if not self.llm_provider.openai_api_key:
-                raise ValueError("OpenAI provider selected but OPENAI_API_KEY is not set")
-            return GenerativeConfig.openai(
-                api_key=self.llm_provider.openai_api_key,
-                base_url=self.llm_provider.openai_api_base if self.llm_provider.openai_api_base else None,
-                model=self.llm_provider.openai_model,
-            )
-        
-        elif provider == "ollama":
-            return GenerativeConfig.ollama(
-                api_endpoint=self.llm_provider.ollama_api_url,
-                model=self.llm_provider.ollama_model,
-            )
-        
-        elif provider == "vllm":
-            return GenerativeConfig.ollama(
-                api_endpoint=self.llm_provider.vllm_api_url,
-                model=self.llm_provider.vllm_model,
-            )
-        
-        elif provider == "auto":
-            # Auto mode: OpenAI if API key is configured, otherwise error
-            if self.llm_provider.openai_api_key:
-                return GenerativeConfig.openai(
-                    api_key=self.llm_provider.openai_api_key,
-                    base_url=self.llm_provider.openai_api_base if self.llm_provider.openai_api_base else None,
-                    model=self.llm_provider.openai_model,
-                )
-            else:
-                raise ValueError(
-                    "Provider set to 'auto' but no OPENAI_API_KEY configured. "
-                    "Set LLM_PROVIDER explicitly or provide OPENAI_API_KEY"
-                )
-        
-        else:
-            raise ValueError(f"Unknown provider: {provider}. Must be 'openai', 'ollama', 'vllm', or 'auto'")
+        return _resolve_builder("generative", self.llm_provider)()
+
+
+def _require_openai_key(llm: LLMProviderConfig) -> None:
+    if not llm.openai_api_key:
+        raise ValueError("OpenAI provider selected but OPENAI_API_KEY is not set")
+
+
+def _require_auto_openai_key(llm: LLMProviderConfig) -> None:
+    # Auto mode: OpenAI if API key is configured, otherwise error
+    if not llm.openai_api_key:
+        raise ValueError(
+            "Provider set to 'auto' but no OPENAI_API_KEY configured. "
+            "Set LLM_PROVIDER explicitly or provide OPENAI_API_KEY"
+        )
+
+
+# Builders are cached on the plain values they read, so repeated calls for
+# the same provider settings reuse the weaviate config object.
+@functools.lru_cache(maxsize=8)
+def _vector_openai(api_key: str, api_base: str):
+    Configure, _ = _weaviate_config_classes()
+    return Configure.Vectors.text2vec_openai(
+        api_key=api_key,
+        base_url=api_base if api_base else None,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _vector_ollama(api_url: str, model: str):
+    Configure, _ = _weaviate_config_classes()
+    return Configure.Vectors.text2vec_ollama(
+        api_endpoint=api_url,
+        model=model,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _generative_openai(api_key: str, api_base: str, model: str):
+    _, GenerativeConfig = _weaviate_config_classes()
+    return GenerativeConfig.openai(
+        api_key=api_key,
+        base_url=api_base if api_base else None,
+        model=model,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _generative_ollama(api_url: str, model: str):
+    _, GenerativeConfig = _weaviate_config_classes()
+    return GenerativeConfig.ollama(
+        api_endpoint=api_url,
+        model=model,
+    )
+
+
+# provider -> (precondition, builder, LLMProviderConfig fields passed to the
+# builder). vLLM is served through the Ollama-compatible weaviate modules and
+# "auto" resolves to OpenAI when a key is set.
+_VECTOR_BUILDERS = {
+    "openai": (_require_openai_key, _vector_openai, ("openai_api_key", "openai_api_base")),
+    "ollama": (None, _vector_ollama, ("ollama_api_url", "embedding_model")),
+    "vllm": (None, _vector_ollama, ("vllm_api_url", "embedding_model")),
+    "auto": (_require_auto_openai_key, _vector_openai, ("openai_api_key", "openai_api_base")),
+}
+
+_GENERATIVE_BUILDERS = {
+    "openai": (
+        _require_openai_key,
+        _generative_openai,
+        ("openai_api_key", "openai_api_base", "openai_model"),
+    ),
+    "ollama": (None, _generative_ollama, ("ollama_api_url", "ollama_model")),
+    "vllm": (None, _generative_ollama, ("vllm_api_url", "vllm_model")),
+    "auto": (
+        _require_auto_openai_key,
+        _generative_openai,
+        ("openai_api_key", "openai_api_base", "openai_model"),
+    ),
+}
+
+
+_PROVIDER_BUILDERS = {
+    "vector": _VECTOR_BUILDERS,
+    "generative": _GENERATIVE_BUILDERS,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_builder(kind: str, llm: LLMProviderConfig):
+    """Resolve and validate the *kind* builder for *llm* once.
+
+    LLMProviderConfig is frozen, so it keys the cache directly; later calls
+    get the bound builder back without re-checking the provider.
+    """
+    try:
+        check, build, attrs = _PROVIDER_BUILDERS[kind][llm.provider]
+    except KeyError:
+        raise ValueError(
+            f"Unknown provider: {llm.provider}. Must be 'openai', 'ollama', 'vllm', or 'auto'"
+        ) from None
+    if check is not None:
+        check(llm)
+    return functools.partial(build, *(getattr(llm, name) for name in attrs))
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide configuration, read from the environment once."""
+    return Config.from_env()
+
+
+def reset_config() -> None:
+    """Drop the cached configuration so the next ``get_config()`` re-reads the environment."""
+    get_config.cache_clear()
@@ -19,13 +19,26 @@ logger = logging.getLogger(__name__)
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+def _utf8_len(text: str) -> int:
+    """UTF-8 size of *text*; ASCII text is measured without encoding it."""
+    return len(text) if text.isascii() else len(text.encode("utf-8", errors="replace"))
+
+
 def _truncate_chunk(chunk: str, max_bytes: int) -> str:
+    if chunk.isascii() and len(chunk) <= max_bytes:
+        return chunk
     encoded = chunk.encode("utf-8", errors="replace")
     if len(encoded) <= max_bytes:
         return chunk
+    logger.debug("Truncating chunk from %d to %d bytes", len(encoded), max_bytes)
     return encoded[:max_bytes].decode("utf-8", errors="ignore")
 
 
+def _sized(parts: list[str]) -> list[tuple[str, int]]:
+    """Pair each part with its UTF-8 byte length, measured once."""
+    return [(part, _utf8_len(part)) for part in parts]
+
+
 def _generic_line_chunk(content: str, chunk_size_bytes: int) -> list[str]:
     """Fallback: split on raw lines when a section exceeds the size budget."""
     # Imported lazily to avoid a hard circular dependency at module load time.
@@ -53,18 +66,16 @@ class MarkdownChunker(DocChunker):
     """Split Markdown at heading boundaries (``#`` through ``######``)."""
 
     _HEADING = re.compile(r"^#{1,6} ", re.MULTILINE)
+    # Zero-width split just before each heading: yields the preamble (empty
+    # when the document starts with a heading) followed by one section each.
+    _SECTION_START = re.compile(r"^(?=#{1,6} )", re.MULTILINE)
 
     def chunk(self, content: str, chunk_size_bytes: int) -> list[str]:
-        splits = [m.start() for m in self._HEADING.finditer(content)]
-        if not splits:
+        sections = self._SECTION_START.split(content)
+        if len(sections) == 1:
             return _generic_line_chunk(content, chunk_size_bytes)
-
-        sections: list[str] = []
-        if splits[0] > 0:
-            sections.append(content[: splits[0]])
-        for i, start in enumerate(splits):
-            end = splits[i + 1] if i + 1 < len(splits) else len(content)
-            sections.append(content[start:end])
+        if not sections[0]:
+            del sections[0]
 
         return self._pack(sections, chunk_size_bytes)
 
@@ -73,9 +84,9 @@ class MarkdownChunker(DocChunker):
         current_parts: list[str] = []
         current_size = 0
         last_heading = ""
+        last_heading_bytes = 0
 
-        for section in sections:
-            section_bytes = len(section.encode("utf-8", errors="replace"))
+        for section, section_bytes in _sized(sections):
 
             if section_bytes > chunk_size_bytes:
                 if current_parts:
@@ -89,11 +100,12 @@ class MarkdownChunker(DocChunker):
                 chunks.append("".join(current_parts))
                 # Carry the previous heading as overlap context.
                 current_parts = [last_heading] if last_heading else []
-                current_size = len(last_heading.encode("utf-8", errors="replace"))
+                current_size = last_heading_bytes
 
             first_line = section.split("\n", 1)[0]
             if self._HEADING.match(first_line):
                 last_heading = first_line + "\n"
+                last_heading_bytes = _utf8_len(last_heading)
 
             current_parts.append(section)
             current_size += section_bytes
@@ -169,9 +181,9 @@ class RSTChunker(DocChunker):
         current_parts: list[str] = []
         current_size = 0
         last_title = ""
+        last_title_bytes = 0
 
-        for section in sections:
-            section_bytes = len(section.encode("utf-8", errors="replace"))
+        for section, section_bytes in _sized(sections):
 
             if section_bytes > chunk_size_bytes:
                 if current_parts:
@@ -184,11 +196,12 @@ class RSTChunker(DocChunker):
             if current_parts and current_size + section_bytes > chunk_size_bytes:
                 chunks.append("".join(current_parts))
                 current_parts = [last_title] if last_title else []
-                current_size = len(last_title.encode("utf-8", errors="replace"))
+                current_size = last_title_bytes
 
             # Capture the title (first 1–3 lines of a section) for overlap.
             head_lines = section.splitlines(keepends=True)[:3]
             last_title = "".join(head_lines)
+            last_title_bytes = _utf8_len(last_title)
 
             current_parts.append(section)
             current_size += section_bytes
@@ -221,9 +234,9 @@ class PlainTextChunker(DocChunker):
         chunks: list[str] = []
         current_parts: list[str] = []
         current_size = 0
+        last_bytes = 0
 
-        for para in paragraphs:
-            para_bytes = len(para.encode("utf-8", errors="replace"))
+        for para, para_bytes in _sized(paragraphs):
 
             if para_bytes > chunk_size_bytes:
                 if current_parts:
@@ -236,12 +249,12 @@ class PlainTextChunker(DocChunker):
             if current_parts and current_size + para_bytes > chunk_size_bytes:
                 chunks.append("".join(current_parts))
                 # Carry the last paragraph as overlap context.
-                last = current_parts[-1]
-                current_parts = [last]
-                current_size = len(last.encode("utf-8", errors="replace"))
+                current_parts = [current_parts[-1]]
+                current_size = last_bytes
 
             current_parts.append(para)
             current_size += para_bytes
+            last_bytes = para_bytes
 
         if current_parts:
             chunks.append("".join(current_parts))
@@ -1,20 +1,31 @@
 """Index code snippets from local zip archives into Weaviate."""
 
+import bisect
+import functools
 import logging
+import multiprocessing
 import os
 import re
-import tempfile
+import uuid
 import zipfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 from weaviate.classes.config import DataType, Property
+from weaviate.classes.query import Filter
 
 from neoflow.config import Config
-from neoflow.weaviate_client import create_weaviate_client
+from neoflow.importer.chunkers import _truncate_chunk, _utf8_len
+from neoflow.weaviate_client import weaviate_client_scope
 
 logger = logging.getLogger(__name__)
 
 OVERLAP_LINES = 2
 
+# Imports with at least this many files chunk in worker processes; smaller
+# ones stay in-process, where spawning workers would cost more than it saves.
+PROCESS_POOL_MIN_FILES = 200
+
 CODE_EXTENSIONS = frozenset({
     ".py", ".pyx", ".pxd",
     ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs",
@@ -30,7 +41,7 @@ CODE_EXTENSIONS = frozenset({
     ".php",
     ".dart",
     ".lua",
-    ".r", ".R",
+    ".r",
 })
 
 SKIP_DIRS = frozenset({
@@ -54,48 +65,87 @@ SKIP_FILE_PATTERNS = [
     re.compile(r"\.generated\.\w+$"),
     re.compile(r"\.d\.ts$"),
 ]
+_SKIP_FILE_PATTERN = re.compile("|".join(pattern.pattern for pattern in SKIP_FILE_PATTERNS))
 
 _IMPORT_PATTERNS = [
-    re.compile(r"^\s*import\s+(.+)", re.MULTILINE),
-    re.compile(r"^\s*from\s+(\S+)\s+import", re.MULTILINE),
-    re.compile(r"^\s*require\s*\(\s*['\"](.+?)['\"]\s*\)", re.MULTILINE),
-    re.compile(r"^\s*#include\s+[<\"](.+?)[>\"]", re.MULTILINE),
-    re.compile(r"^\s*using\s+([\w.]+)\s*;", re.MULTILINE),
+    re.compile(r"^[ \t]*import\s+(.+)", re.MULTILINE),
+    re.compile(r"^[ \t]*from\s+(\S+)\s+import", re.MULTILINE),
+    re.compile(r"^[ \t]*require\s*\(\s*['\"](.+?)['\"]\s*\)", re.MULTILINE),
+    re.compile(r"^[ \t]*#include\s+[<\"](.+?)[>\"]", re.MULTILINE),
+    re.compile(r"^[ \t]*using\s+([\w.]+)\s*;", re.MULTILINE),
 ]
 
 _DEFINITION_PATTERNS = [
-    re.compile(r"^\s*(?:export\s+)?(?:abstract\s+)?class\s+(\w+)", re.MULTILINE),
-    re.compile(r"^\s*(?:export\s+)?(?:async\s+)?function\s+(\w+)", re.MULTILINE),
-    re.compile(r"^\s*def\s+(\w+)\s*\(", re.MULTILINE),
-    re.compile(r"^\s*func\s+(\w+)\s*\(", re.MULTILINE),
-    re.compile(r"^\s*(?:export\s+)?interface\s+(\w+)", re.MULTILINE),
-    re.compile(r"^\s*(?:export\s+)?type\s+(\w+)\s*=", re.MULTILINE),
-    re.compile(r"^\s*struct\s+(\w+)", re.MULTILINE),
-    re.compile(r"^\s*enum\s+(\w+)", re.MULTILINE),
+    re.compile(r"^[ \t]*(?:export\s+)?(?:abstract\s+)?class\s+(\w+)", re.MULTILINE),
+    re.compile(r"^[ \t]*(?:export\s+)?(?:async\s+)?function\s+(\w+)", re.MULTILINE),
+    re.compile(r"^[ \t]*def\s+(\w+)\s*\(", re.MULTILINE),
+    re.compile(r"^[ \t]*func\s+(\w+)\s*\(", re.MULTILINE),
+    re.compile(r"^[ \t]*(?:export\s+)?interface\s+(\w+)", re.MULTILINE),
+    re.compile(r"^[ \t]*(?:export\s+)?type\s+(\w+)\s*=", re.MULTILINE),
+    re.compile(r"^[ \t]*struct\s+(\w+)", re.MULTILINE),
+    re.compile(r"^[ \t]*enum\s+(\w+)", re.MULTILINE),
 ]
 
+
+def _named_alternatives(prefix: str, patterns: list[re.Pattern]) -> list[str]:
+    return [f"(?P<{prefix}{i}>{pattern.pattern})" for i, pattern in enumerate(patterns)]
+
+
+# Each family is fused into one alternation so a file is scanned once rather
+# than once per pattern, and _SYMBOL_PATTERN fuses both families. Every
+# alternative is wrapped in a named group; the symbol is the capture group
+# directly inside it. Matches come back in source order.
+_IMPORT_PATTERN = re.compile(
+    "|".join(_named_alternatives("imp", _IMPORT_PATTERNS)), re.MULTILINE
+)
+_DEFINITION_PATTERN = re.compile(
+    "|".join(_named_alternatives("def", _DEFINITION_PATTERNS)), re.MULTILINE
+)
+_SYMBOL_PATTERN = re.compile(
+    "|".join(
+        _named_alternatives("imp", _IMPORT_PATTERNS)
+        + _named_alternatives("def", _DEFINITION_PATTERNS)
+    ),
+    re.MULTILINE,
+)
+
+
+def _symbol_groups(pattern: re.Pattern) -> dict[str, int]:
+    return {name: index + 1 for name, index in pattern.groupindex.items()}
+
+
+_IMPORT_GROUPS = _symbol_groups(_IMPORT_PATTERN)
+_DEFINITION_GROUPS = _symbol_groups(_DEFINITION_PATTERN)
+_SYMBOL_GROUPS = _symbol_groups(_SYMBOL_PATTERN)
+
 _TEST_INDICATORS = re.compile(
     r"(^|/)tests?/|_test\.\w+$|\.test\.\w+$|\.spec\.\w+$|test_\w+\.py$",
 )
 
-BOUNDARY_PATTERNS = [
-    re.compile(r"^(class |def |function |async function |export |public |private |protected )"),
-    re.compile(r"^(func |type |struct |interface )"),
-    re.compile(r"^(package |import )"),
-]
+# One alternation so each line costs a single match call. Indentation is
+# matched by the pattern instead of stripping every line first.
+BOUNDARY_PATTERN = re.compile(
+    r"\s*(?:class |def |function |async function |export |public |private |protected "
+    r"|func |type |struct |interface "
+    r"|package |import )"
+)
 
 
 def _is_code_file(file_path: str) -> bool:
-    basename = os.path.basename(file_path)
+    return _is_code_file_name(os.path.basename(file_path))
 
-    if basename in SKIP_FILES:
+
+def _is_code_file_name(basename: str) -> bool:
+    # The extension lookup rejects most files, so it runs before the
+    # skip-list and regex checks.
+    stem, _, ext = basename.rpartition(".")
+    if not stem or f".{ext.lower()}" not in CODE_EXTENSIONS:
         return False
 
-    if any(pattern.search(basename) for pattern in SKIP_FILE_PATTERNS):
+    if basename in SKIP_FILES:
         return False
 
-    _, ext = os.path.splitext(basename)
-    return ext.lower() in CODE_EXTENSIONS
+    return _SKIP_FILE_PATTERN.search(basename) is None
 
 
 def _should_skip_dir(dirname: str) -> bool:
@@ -108,114 +158,158 @@ def _is_test_file(file_path: str) -> bool:
 
 def _extract_imports(content: str) -> list[str]:
     imports = []
-    for pattern in _IMPORT_PATTERNS:
-        for match in pattern.finditer(content):
-            imp = match.group(1).strip().rstrip(";")
-            if imp and len(imp) < 200:
-                imports.append(imp)
+    for match in _IMPORT_PATTERN.finditer(content):
+        imp = match.group(_IMPORT_GROUPS[match.lastgroup]).strip().rstrip(";")
+        if imp and len(imp) < 200:
+            imports.append(imp)
     return imports
 
 
 def _extract_definitions(content: str) -> list[str]:
-    definitions = []
-    for pattern in _DEFINITION_PATTERNS:
-        for match in pattern.finditer(content):
-            name = match.group(1)
-            if name and name not in definitions:
-                definitions.append(name)
+    definitions: list[str] = []
+    seen: set[str] = set()
+    for match in _DEFINITION_PATTERN.finditer(content):
+        name = match.group(_DEFINITION_GROUPS[match.lastgroup])
+        if name and name not in seen:
+            seen.add(name)
+            definitions.append(name)
     return definitions
 
 
-def _compute_line_ranges(content: str, chunks: list[str]) -> list[tuple[int, int]]:
-    ranges = []
-    search_from = 0
-    for chunk in chunks:
-        start_idx = content.find(chunk[:80], search_from)
-        if start_idx == -1:
-            start_idx = search_from
-
-        line_start = content[:start_idx].count("\n") + 1
-        line_end = line_start + chunk.count("\n")
-        ranges.append((line_start, line_end))
-        search_from = start_idx + len(chunk) // 2
-    return ranges
-
-
-def _detect_language(file_path: str) -> str:
-    ext_map = {
-        ".py": "python", ".pyx": "cython", ".pxd": "cython",
-        ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript", ".cjs": "javascript",
-        ".ts": "typescript", ".tsx": "typescript",
-        ".java": "java", ".kt": "kotlin", ".kts": "kotlin",
-        ".scala": "scala", ".groovy": "groovy",
-        ".go": "go",
-        ".rs": "rust",
-        ".c": "c", ".h": "c", ".cpp": "cpp", ".hpp": "cpp", ".cc": "cpp", ".hh": "cpp", ".cxx": "cpp",
-        ".cs": "csharp",
-        ".rb": "ruby",
-        ".swift": "swift",
-        ".sql": "sql",
-        ".sh": "shell", ".bash": "shell", ".zsh": "shell",
-        ".php": "php",
-        ".dart": "dart",
-        ".lua": "lua",
-        ".r": "r", ".R": "r",
-        ".md": "markdown",
-        ".yaml": "yaml", ".yml": "yaml",
-        ".json": "json", ".xml": "xml",
-    }
-    _, ext = os.path.splitext(file_path)
-    return ext_map.get(ext, ext.lstrip("."))
+def _extract_symbols(content: str) -> tuple[list[str], list[tuple[int, str]]]:
+    """Return imports and ``(line, name)`` definitions in *content* in one regex pass.
+
+    Definitions are not deduplicated, so they can be split between chunks by
+    line number; both lists are in source order.
+    """
+    imports: list[str] = []
+    definitions: list[tuple[int, str]] = []
+    prev_start = 0
+    line = 1
+    for match in _SYMBOL_PATTERN.finditer(content):
+        kind = match.lastgroup
+        value = match.group(_SYMBOL_GROUPS[kind])
+        if kind.startswith("imp"):
+            imp = value.strip().rstrip(";")
+            if imp and len(imp) < 200:
+                imports.append(imp)
+        elif value:
+            start = match.start()
+            line += content.count("\n", prev_start, start)
+            prev_start = start
+            definitions.append((line, value))
+    return imports, definitions
 
 
-def _is_boundary_line(line: str) -> bool:
-    stripped = line.lstrip()
-    return any(pattern.match(stripped) for pattern in BOUNDARY_PATTERNS)
+# Namespace for the name-based (v5) ids of CodeSnippets objects.
+_CHUNK_UUID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "neoflow:CodeSnippets")
 
 
-def _truncate_chunk(chunk: str, max_bytes: int) -> str:
-    encoded = chunk.encode("utf-8", errors="replace")
-    if len(encoded) <= max_bytes:
-        return chunk
-    logger.debug("Truncating chunk from %d to %d bytes", len(encoded), max_bytes)
-    return encoded[:max_bytes].decode("utf-8", errors="ignore")
+def _chunk_uuid(repo_name: str, pack_name: str, file_path: str, chunk_index: int) -> uuid.UUID:
+    """Deterministic object id for one chunk of one file."""
+    return uuid.uuid5(
+        _CHUNK_UUID_NAMESPACE, f"{repo_name}|{pack_name}|{file_path}|{chunk_index}"
+    )
 
 
-def chunk_content(content: str, chunk_size_bytes: int) -> list[str]:
-    if len(content.encode("utf-8", errors="replace")) <= chunk_size_bytes:
-        return [content]
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python", ".pyx": "cython", ".pxd": "cython",
+    ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript", ".cjs": "javascript",
+    ".ts": "typescript", ".tsx": "typescript",
+    ".java": "java", ".kt": "kotlin", ".kts": "kotlin",
+    ".scala": "scala", ".groovy": "groovy",
+    ".go": "go",
+    ".rs": "rust",
+    ".c": "c", ".h": "c", ".cpp": "cpp", ".hpp": "cpp", ".cc": "cpp", ".hh": "cpp", ".cxx": "cpp",
+    ".cs": "csharp",
+    ".rb": "ruby",
+    ".swift": "swift",
+    ".sql": "sql",
+    ".sh": "shell", ".bash": "shell", ".zsh": "shell",
+    ".php": "php",
+    ".dart": "dart",
+    ".lua": "lua",
+    ".r": "r", ".R": "r",
+    ".md": "markdown",
+    ".yaml": "yaml", ".yml": "yaml",
+    ".json": "json", ".xml": "xml",
+}
 
-    lines = content.splitlines(keepends=True)
-    chunks: list[str] = []
-    current_chunk_lines: list[str] = []
-    current_size = 0
 
-    for line in lines:
-        line_size = len(line.encode("utf-8", errors="replace"))
+def _detect_language(file_path: str) -> str:
+    _, ext = os.path.splitext(file_path)
+    return _LANGUAGE_BY_EXTENSION.get(ext, ext.lstrip("."))
 
-        if current_chunk_lines and (
-            _is_boundary_line(line)
-            or current_size + line_size > chunk_size_bytes
-        ):
-            chunk_text = "".join(current_chunk_lines)
-            chunks.append(chunk_text)
-            overlap_start = max(0, len(current_chunk_lines) - OVERLAP_LINES)
-            overlap_lines = current_chunk_lines[overlap_start:]
-            current_chunk_lines = overlap_lines
-            current_size = sum(len(part.encode("utf-8", errors="replace")) for part in overlap_lines)
 
-        current_chunk_lines.append(line)
-        current_size += line_size
+def _is_boundary_line(line: str) -> bool:
+    return BOUNDARY_PATTERN.match(line) is not None
+
+
+@functools.lru_cache(maxsize=8)
+def make_chunker(chunk_size_bytes: int, overlap_lines: int = OVERLAP_LINES):
+    """Return a ``chunk(content)`` function for a fixed chunk size.
+
+    The returned function yields ``(chunk, line_start, line_end)`` tuples; the
+    line range is tracked while walking the lines rather than searched for
+    afterwards. The size, overlap and helpers are bound as closure locals once
+    per configuration instead of being looked up for every line.
+    """
+    is_boundary = _is_boundary_line
+    truncate = _truncate_chunk
+
+    def ranged(text: str, line_start: int) -> tuple[str, int, int]:
+        text = truncate(text, chunk_size_bytes)
+        return text, line_start, line_start + text.count("\n")
+
+    def chunk(content: str) -> list[tuple[str, int, int]]:
+        if _utf8_len(content) <= chunk_size_bytes:
+            return [ranged(content, 1)]
+
+        lines = content.splitlines(keepends=True)
+        # Only lines with non-ASCII characters are actually encoded.
+        line_sizes = map(_utf8_len, lines)
+        chunks: list[tuple[str, int, int]] = []
+        current_chunk_lines: list[str] = []
+        # Byte size of each line in current_chunk_lines, so the overlap carried
+        # into the next chunk is re-measured without encoding it again.
+        current_line_sizes: list[int] = []
+        current_size = 0
+        # Numbered by "\n" like editors do; splitlines() also breaks on e.g.
+        # form feeds, which do not start a new line number.
+        current_line_start = 1
+
+        for line, line_size in zip(lines, line_sizes):
+            if current_chunk_lines and (
+                is_boundary(line)
+                or current_size + line_size > chunk_size_bytes
+            ):
+                chunks.append(ranged("".join(current_chunk_lines), current_line_start))
+                overlap_start = max(0, len(current_chunk_lines) - overlap_lines)
+                for dropped in current_chunk_lines[:overlap_start]:
+                    if dropped.endswith("\n"):
+                        current_line_start += 1
+                current_chunk_lines = current_chunk_lines[overlap_start:]
+                current_line_sizes = current_line_sizes[overlap_start:]
+                current_size = sum(current_line_sizes)
+
+            current_chunk_lines.append(line)
+            current_line_sizes.append(line_size)
+            current_size += line_size
+
+        if current_chunk_lines:
+            chunks.append(ranged("".join(current_chunk_lines), current_line_start))
+
+        return chunks or [ranged(content, 1)]
+
+    return chunk
 
-    if current_chunk_lines:
-        chunks.append("".join(current_chunk_lines))
 
-    result = chunks if chunks else [content]
-    return [_truncate_chunk(chunk, chunk_size_bytes) for chunk in result]
+def chunk_content(content: str, chunk_size_bytes: int) -> list[str]:
+    return [text for text, _, _ in make_chunker(chunk_size_bytes)(content)]
 
 
-def _connect_weaviate(config: Config):
-    return create_weaviate_client(config)
+def _connect_weaviate(config: Config, client=None):
+    return weaviate_client_scope(config, client)
 
 
 def _create_code_snippets_collection(client, config: Config):
@@ -254,6 +348,33 @@ def _ensure_code_snippets_collection(client, config: Config):
         _create_code_snippets_collection(client, config)
 
 
+def _delete_existing_repo_chunks(collection, repo_name: str, pack_name: str) -> int:
+    """Delete the chunks a previous import of *repo_name* into *pack_name* left.
+
+    A re-import can produce fewer chunks per file, or drop files entirely, so
+    the old objects are removed rather than overwritten by id.
+    """
+    filters = (
+        Filter.by_property("repository").equal(repo_name)
+        & Filter.by_property("pack_name").equal(pack_name)
+    )
+    total_deleted = 0
+    while True:
+        result = collection.query.fetch_objects(
+            filters=filters,
+            limit=200,
+            return_properties=["pack_name"],
+        )
+        if not result.objects:
+            break
+
+        for obj in result.objects:
+            collection.data.delete_by_id(obj.uuid)
+            total_deleted += 1
+
+    return total_deleted
+
+
 def _ensure_pack_name_property(collection):
     try:
         collection.config.add_property(
@@ -264,97 +385,218 @@ def _ensure_pack_name_property(collection):
 
 
 def _collect_code_files(root: str) -> list[str]:
+    # Depth-first over os.scandir: DirEntry carries the type from the
+    # directory listing, so no extra stat is needed per entry. Like os.walk,
+    # symlinked directories are not followed and unreadable ones are skipped.
     files: list[str] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [dirname for dirname in dirnames if not _should_skip_dir(dirname)]
-
-        for filename in filenames:
-            rel_path = os.path.relpath(os.path.join(dirpath, filename), root)
-            if _is_code_file(rel_path):
-                files.append(os.path.join(dirpath, filename))
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink() and not _should_skip_dir(entry.name):
+                            stack.append(entry.path)
+                    elif _is_code_file_name(entry.name):
+                        files.append(entry.path)
+        except OSError:
+            continue
     return files
 
 
+def _decode_source(raw: bytes) -> str:
+    """Decode file bytes the way text-mode ``open(errors="replace")`` does."""
+    return raw.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_code_file(full_path: str):
+    """Read *full_path*, returning ``(raw_bytes, None)`` or ``(None, error)``."""
+    try:
+        with open(full_path, "rb") as file:
+            return file.read(), None
+    except Exception as exc:
+        return None, exc
+
+
+def _prefetched(pool: Executor, fn, items, window: int):
+    """Yield ``fn(item)`` for *items* in order, keeping up to *window* calls in flight."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _prepare_code_file(source: tuple[str, bytes], chunk_size_bytes: int) -> list[dict]:
+    """Decode and chunk one ``(rel_path, raw_bytes)`` file into per-chunk properties.
+
+    This is the CPU-bound part of the import and runs in worker processes
+    for large imports, so it must stay a picklable module-level function.
+    """
+    rel_path, raw = source
+    content = _decode_source(raw)
+    language = _detect_language(rel_path)
+    is_test = _is_test_file(rel_path)
+    file_name = os.path.basename(rel_path)
+    directory = os.path.dirname(rel_path) or "."
+    imports, definitions = _extract_symbols(content)
+    imports_text = "\n".join(imports) if imports else ""
+    definition_lines = [line for line, _ in definitions]
+
+    chunks = make_chunker(chunk_size_bytes)(content)
+    total_chunks = len(chunks)
+
+    records = []
+    for chunk_idx, (chunk, line_start, line_end) in enumerate(chunks):
+        # The file was scanned once above; each chunk takes the definitions
+        # on its own lines. line_end counts a trailing newline as a line.
+        last_line = line_end - chunk.endswith("\n")
+        chunk_definitions = list(dict.fromkeys(
+            name
+            for _, name in definitions[
+                bisect.bisect_left(definition_lines, line_start):
+                bisect.bisect_right(definition_lines, last_line)
+            ]
+        ))
+        records.append({
+            "file_path": rel_path,
+            "file_name": file_name,
+            "directory": directory,
+            "content": chunk,
+            "language": language,
+            "is_test": is_test,
+            "chunk_index": chunk_idx,
+            "total_chunks": total_chunks,
+            "line_start": line_start,
+            "line_end": line_end,
+            "imports": imports_text,
+            "definitions": ", ".join(chunk_definitions) if chunk_definitions else "",
+        })
+    return records
+
+
 def _index_code_from_root(
     root: str,
     repo_name: str,
     source_label: str,
     config: Config,
     pack_name: str = "manual-import",
+    client=None,
 ):
-    max_size = config.importer.max_file_size_bytes
-    files = _collect_code_files(root)
+    sources = [(os.path.relpath(path, root), path) for path in _collect_code_files(root)]
+    _index_code_sources(
+        sources, _read_code_file, repo_name, source_label, config,
+        pack_name=pack_name, client=client,
+    )
 
-    logger.info("Found %d code files in %s", len(files), source_label)
 
-    with _connect_weaviate(config) as weaviate_client:
-        _ensure_code_snippets_collection(weaviate_client, config)
-        collection = weaviate_client.collections.use("CodeSnippets")
-        _ensure_pack_name_property(collection)
+def _index_code_sources(
+    sources: list[tuple[str, object]],
+    read,
+    repo_name: str,
+    source_label: str,
+    config: Config,
+    pack_name: str = "manual-import",
+    client=None,
+    skipped: int = 0,
+):
+    """Index ``(rel_path, handle)`` *sources*, loading each with ``read(handle)``.
 
-        indexed = 0
-        skipped = 0
+    *read* returns ``(raw_bytes, None)`` or ``(None, error)`` and is called
+    from a thread pool. *skipped* counts files the caller already dropped.
+    """
+    max_size = config.importer.max_file_size_bytes
 
-        for full_path in files:
-            rel_path = os.path.relpath(full_path, root)
+    logger.info("Found %d code files in %s", len(sources), source_label)
 
-            try:
-                with open(full_path, "r", encoding="utf-8", errors="replace") as file:
-                    content = file.read()
-            except Exception as exc:
-                logger.warning("Failed to read %s: %s", rel_path, exc)
+    workers = max(1, config.importer.max_workers)
+    prepare = functools.partial(
+        _prepare_code_file, chunk_size_bytes=config.llm_provider.chunk_size_bytes
+    )
+    prepare_workers = min(os.cpu_count() or 1, workers)
+    use_processes = len(sources) >= PROCESS_POOL_MIN_FILES and prepare_workers > 1
+
+    indexed = 0
+
+    def readable_sources(reads):
+        nonlocal skipped
+        for (rel_path, _), (raw, read_error) in zip(sources, reads):
+            if read_error is not None:
+                logger.warning("Failed to read %s: %s", rel_path, read_error)
                 skipped += 1
                 continue
 
-            if len(content.encode("utf-8", errors="replace")) > max_size:
+            # Sized on the raw bytes: oversized files are never decoded.
+            if len(raw) > max_size:
                 logger.debug("Skipping oversized file: %s", rel_path)
                 skipped += 1
                 continue
 
-            language = _detect_language(rel_path)
-            is_test = _is_test_file(rel_path)
-            file_name = os.path.basename(rel_path)
-            directory = os.path.dirname(rel_path) or "."
-            imports = _extract_imports(content)
-            definitions = _extract_definitions(content)
-
-            chunks = chunk_content(content, config.llm_provider.chunk_size_bytes)
-            total_chunks = len(chunks)
-            line_ranges = _compute_line_ranges(content, chunks)
-
-            for chunk_idx, chunk in enumerate(chunks):
-                line_start, line_end = line_ranges[chunk_idx]
-                chunk_definitions = _extract_definitions(chunk)
-
-                try:
-                    collection.data.insert(
-                        properties={
-                            "repository": repo_name,
-                            "file_path": rel_path,
-                            "file_name": file_name,
-                            "directory": directory,
-                            "content": chunk,
-                            "language": language,
-                            "is_test": is_test,
-                            "chunk_index": chunk_idx,
-                            "total_chunks": total_chunks,
-                            "line_start": line_start,
-                            "line_end": line_end,
-                            "imports": "\n".join(imports) if imports else "",
-                            "definitions": ", ".join(chunk_definitions) if chunk_definitions else "",
-                            "pack_name": pack_name,
-                        }
-                    )
-                    indexed += 1
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to index chunk %d/%d of %s: %s",
-                        chunk_idx + 1,
-                        total_chunks,
-                        rel_path,
-                        exc,
-                    )
-                    skipped += 1
+            yield rel_path, raw
+
+    with (
+        _connect_weaviate(config, client) as weaviate_client,
+        ThreadPoolExecutor(max_workers=workers) as read_pool,
+    ):
+        _ensure_code_snippets_collection(weaviate_client, config)
+        collection = weaviate_client.collections.use("CodeSnippets")
+        _ensure_pack_name_property(collection)
+        deleted = _delete_existing_repo_chunks(collection, repo_name, pack_name)
+        if deleted:
+            logger.info("Removed %d chunks from the previous import of %s", deleted, repo_name)
+
+        # Reads run ahead on a small thread pool so disk (or network
+        # filesystem) latency overlaps with chunking and inserting; chunking
+        # runs on worker processes for large imports. Chunks go through one
+        # batch context for the whole import instead of one insert round-trip
+        # each.
+        handles = (handle for _, handle in sources)
+        reads = _prefetched(read_pool, read, handles, window=2 * workers)
+        loaded = readable_sources(reads)
+        prepare_pool = None
+        if use_processes:
+            # spawn rather than fork: the parent already holds the Weaviate
+            # client's gRPC threads, which must not be forked.
+            prepare_pool = ProcessPoolExecutor(
+                max_workers=prepare_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            prepared = _prefetched(prepare_pool, prepare, loaded, window=2 * prepare_workers)
+        else:
+            prepared = map(prepare, loaded)
+
+        try:
+            with collection.batch.fixed_size(batch_size=config.importer.batch_size) as batch:
+                for records in prepared:
+                    for properties in records:
+                        properties["repository"] = repo_name
+                        properties["pack_name"] = pack_name
+                        batch.add_object(
+                            properties=properties,
+                            uuid=_chunk_uuid(
+                                repo_name,
+                                pack_name,
+                                properties["file_path"],
+                                properties["chunk_index"],
+                            ),
+                        )
+                        indexed += 1
+        finally:
+            if prepare_pool is not None:
+                prepare_pool.shutdown(cancel_futures=True)
+
+        failed = collection.batch.failed_objects
+        if failed:
+            for failure in failed[:5]:
+                logger.warning("Failed to index code chunk: %s", failure.message)
+            indexed -= len(failed)
+            skipped += len(failed)
 
     logger.info(
         "Code import %s from %s: indexed %d chunks, %d skipped",
@@ -370,30 +612,64 @@ def index_zip_file(
     repo_name: str,
     config: Config,
     pack_name: str = "manual-import",
+    client=None,
 ):
     if not zipfile.is_zipfile(zip_path):
         raise ValueError(f"Not a valid zip file: {zip_path}")
 
     MAX_UNCOMPRESSED = 500 * 1024 * 1024  # 500 MB total
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        with zipfile.ZipFile(zip_path, "r") as archive:
-            total_size = 0
-            for member in archive.infolist():
-                if member.filename.startswith('/') or '..' in member.filename:
-                    raise ValueError(f"Unsafe path in zip: {member.filename}")
-                total_size += member.file_size
-                if total_size > MAX_UNCOMPRESSED:
-                    raise ValueError("Zip file exceeds maximum uncompressed size (500 MB)")
-            archive.extractall(tmp_dir)
-
-        entries = os.listdir(tmp_dir)
-        if len(entries) == 1 and os.path.isdir(os.path.join(tmp_dir, entries[0])):
-            root = os.path.join(tmp_dir, entries[0])
-        else:
-            root = tmp_dir
+    # Members are read straight from the archive: nothing is extracted to
+    # disk, and filtered-out files are never decompressed.
+    with zipfile.ZipFile(zip_path, "r") as archive:
+        members = archive.infolist()
+        total_size = 0
+        for member in members:
+            if member.filename.startswith('/') or '..' in member.filename:
+                raise ValueError(f"Unsafe path in zip: {member.filename}")
+            total_size += member.file_size
+            if total_size > MAX_UNCOMPRESSED:
+                raise ValueError("Zip file exceeds maximum uncompressed size (500 MB)")
+
+        # A single top-level directory is treated as the repository root.
+        names = [member.filename for member in members]
+        prefix = ""
+        top_levels = {name.split("/", 1)[0] for name in names}
+        if len(top_levels) == 1:
+            top = top_levels.pop()
+            if any(name.startswith(top + "/") for name in names):
+                prefix = top + "/"
+
+        max_size = config.importer.max_file_size_bytes
+        sources = []
+        oversized = 0
+        for member in members:
+            if member.is_dir():
+                continue
+            rel_path = member.filename[len(prefix):]
+            *dirs, _ = rel_path.split("/")
+            if any(_should_skip_dir(dirname) for dirname in dirs):
+                continue
+            if not _is_code_file(rel_path):
+                continue
+            # The uncompressed size is in the directory entry, so oversized
+            # members are dropped without being decompressed.
+            if member.file_size > max_size:
+                logger.debug("Skipping oversized file: %s", rel_path)
+                oversized += 1
+                continue
+            sources.append((rel_path, member))
 
-        _index_code_from_root(root, repo_name, zip_path, config, pack_name=pack_name)
+        def read_member(member: zipfile.ZipInfo):
+            try:
+                return archive.read(member), None
+            except Exception as exc:
+                return None, exc
+
+        _index_code_sources(
+            sources, read_member, repo_name, zip_path, config,
+            pack_name=pack_name, client=client, skipped=oversized,
+        )
 
 
 def index_source_folder(
@@ -401,6 +677,7 @@ def index_source_folder(
     repo_name: str,
     config: Config,
     pack_name: str = "manual-import",
+    client=None,
 ):
     root = os.path.abspath(source_path)
-    _index_code_from_root(root, repo_name, root, config, pack_name=pack_name)
+    _index_code_from_root(root, repo_name, root, config, pack_name=pack_name, client=client)
@@ -7,7 +7,7 @@ from weaviate.classes.config import DataType, Property
 
 from neoflow.config import Config
 from neoflow.importer.chunkers import chunk_doc_content
-from neoflow.weaviate_client import create_weaviate_client
+from neoflow.weaviate_client import weaviate_client_scope
 
 logger = logging.getLogger(__name__)
 
@@ -41,17 +41,23 @@ def _ensure_pack_name_property(collection):
         pass
 
 
-def _connect_weaviate(config: Config):
-    """Create a Weaviate client connection."""
-    return create_weaviate_client(config)
+def _connect_weaviate(config: Config, client=None):
+    """Return a Weaviate client scope, reusing *client* when one is provided."""
+    return weaviate_client_scope(config, client)
 
 
-def import_documentation(doc_path: str, config: Config, pack_name: str = "manual-import"):
+def import_documentation(
+    doc_path: str,
+    config: Config,
+    pack_name: str = "manual-import",
+    client=None,
+):
     """Walk a directory, read UTF-8 files, chunk, and insert into the Documentation collection.
 
     Args:
         doc_path: Path to the documentation directory.
         config: Application configuration.
+        client: Optional open Weaviate client to reuse; it is not closed here.
     """
     doc_path = os.path.abspath(doc_path)
     logger.info("Importing documentation from: %s", doc_path)
@@ -63,7 +69,7 @@ def import_documentation(doc_path: str, config: Config, pack_name: str = "manual
 
     logger.info("Found %d files in %s", len(files), doc_path)
 
-    with _connect_weaviate(config) as client:
+    with _connect_weaviate(config, client) as client:
         _create_documentation_collection(client, config)
         collection = client.collections.use(COLLECTION_NAME)
         _ensure_pack_name_property(collection)
@@ -71,33 +77,41 @@ def import_documentation(doc_path: str, config: Config, pack_name: str = "manual
         indexed = 0
         skipped = 0
 
-        for full_path in files:
-            rel_path = os.path.relpath(full_path, doc_path)
-
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except (UnicodeDecodeError, OSError) as e:
-                logger.debug("Skipping binary/unreadable file %s: %s", rel_path, e)
-                skipped += 1
-                continue
-
-            if not content.strip():
-                logger.debug("Skipping empty file: %s", rel_path)
-                skipped += 1
-                continue
-
-            chunks = chunk_doc_content(content, config.llm_provider.chunk_size_bytes, full_path)
-            for chunk in chunks:
-                collection.data.insert(
-                    properties={
-                        "file_path": rel_path,
-                        "content": chunk,
-                        "source_dir": doc_path,
-                        "pack_name": pack_name,
-                    }
-                )
-                indexed += 1
+        # One batch context for the whole directory: objects are sent in
+        # batch_size groups instead of one round-trip per chunk.
+        with collection.batch.fixed_size(batch_size=config.importer.batch_size) as batch:
+            for full_path in files:
+                rel_path = os.path.relpath(full_path, doc_path)
+
+                try:
+                    with open(full_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                except (UnicodeDecodeError, OSError) as e:
+                    logger.debug("Skipping binary/unreadable file %s: %s", rel_path, e)
+                    skipped += 1
+                    continue
+
+                if not content.strip():
+                    logger.debug("Skipping empty file: %s", rel_path)
+                    skipped += 1
+                    continue
+
+                chunks = chunk_doc_content(content, config.llm_provider.chunk_size_bytes, full_path)
+                for chunk in chunks:
+                    batch.add_object(
+                        properties={
+                            "file_path": rel_path,
+                            "content": chunk,
+                            "source_dir": doc_path,
+                            "pack_name": pack_name,
+                        }
+                    )
+                    indexed += 1
+
+        failed = collection.batch.failed_objects
+        if failed:
+            logger.warning("Failed to index %d documentation chunks", len(failed))
+            indexed -= len(failed)
 
         logger.info(
             "Documentation import: indexed %d chunks from %d files (%d skipped)",
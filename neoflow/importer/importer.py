@@ -8,7 +8,7 @@ from weaviate.classes.query import Filter
 
 from neoflow.config import Config
 from neoflow.models import Ticket
-from neoflow.weaviate_client import create_weaviate_client
+from neoflow.weaviate_client import weaviate_client_scope
 
 logger = logging.getLogger(__name__)
 
@@ -108,17 +108,25 @@ def _process_file(file_path: str, tickets_col, comments_col, batch_size: int, pa
     else:
         question_chunks = [ticket.question or ""]
 
-    for tk in question_chunks:
-        tickets_col.data.insert(
-            properties={
-                "reference": ticket.reference,
-                "title": ticket.metadata.title or "",
-                "question": tk,
-                "url": ticket.metadata.url,
-                "chunk_index": question_chunks.index(tk),
-                "total_chunks": len(question_chunks),
-                "pack_name": pack_name,
-            }
+    # One request for all question chunks; a rejected chunk raises so the
+    # file is counted as failed.
+    result = tickets_col.data.insert_many([
+        {
+            "reference": ticket.reference,
+            "title": ticket.metadata.title or "",
+            "question": tk,
+            "url": ticket.metadata.url,
+            "chunk_index": question_chunks.index(tk),
+            "total_chunks": len(question_chunks),
+            "pack_name": pack_name,
+        }
+        for tk in question_chunks
+    ])
+    if result.has_errors:
+        first_error = next(iter(result.errors.values()))
+        raise RuntimeError(
+            f"Failed to insert {len(result.errors)} question chunk(s) for "
+            f"{ticket.reference}: {first_error.message}"
         )
 
     if not ticket.comments:
@@ -163,8 +171,13 @@ def import_tickets(
     tickets_dir: str | None = None,
     pack_name: str = "manual-import",
     replace_existing: bool = True,
+    client=None,
 ):
-    """Import all ticket JSON files into Weaviate."""
+    """Import all ticket JSON files into Weaviate.
+
+    An already open *client* may be passed in to avoid reconnecting; it is
+    left open when the import finishes.
+    """
     tickets_dir = tickets_dir or config.importer.tickets_dir
     if not os.path.isdir(tickets_dir):
         raise FileNotFoundError(f"Tickets directory not found: {tickets_dir}")
@@ -173,7 +186,7 @@ def import_tickets(
     total = len(files)
     logger.info(f"Found {total} ticket files to import")
 
-    with create_weaviate_client(config) as client:
+    with weaviate_client_scope(config, client) as client:
         _create_collections(client, config)
 
         tickets_col = client.collections.use("Tickets")
@@ -1,10 +1,15 @@
 """Scaffold and manage NeoFlow configuration directories."""
 
+from __future__ import annotations
+
+import functools
 import os
 import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
 NEOFLOW_DIR = ".neoflow"
 AGENT_SYSTEM_PROMPT_DIR = "agent_system_prompt"
@@ -126,11 +131,13 @@ def _copy_missing_files(source: Path, target: Path) -> None:
             shutil.copy2(path, destination)
 
 
+@functools.lru_cache(maxsize=1)
 def bootstrap_user_resource_folders() -> Path:
     """Ensure user-level prompt/template resource folders exist.
 
     On first run, this copies bundled defaults into ``~/.neoflow`` so runtime
-    loading does not depend on project-local resource folders.
+    loading does not depend on project-local resource folders.  The check
+    runs once per process; later calls return the cached home path.
     """
     home_dir = get_neoflow_home_path()
     home_dir.mkdir(parents=True, exist_ok=True)
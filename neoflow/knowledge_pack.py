@@ -14,7 +14,6 @@ from pathlib import Path
 from typing import Callable
 
 from neoflow.config import Config
-from neoflow.weaviate_client import create_weaviate_client
 from neoflow.init import get_neoflow_agent_system_prompt_dir, get_neoflow_home_path
 
 MANIFEST_FILENAME = "manifest.json"
@@ -239,6 +238,8 @@ def resolve_registry_entry(registry: dict, pack_query: str) -> dict | None:
 
 
 def _weaviate_client(config: Config):
+    from neoflow.weaviate_client import create_weaviate_client
+
     return create_weaviate_client(config)
 
 
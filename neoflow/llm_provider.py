@@ -5,14 +5,57 @@ Supports Ollama, vLLM, and OpenAI as LLM backends. Allows runtime selection
 and automatic fallback based on available services and environment configuration.
 """
 
+import atexit
+import functools
 import os
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Return the process-wide pooled HTTP session for Ollama and vLLM calls.
+
+    Reusing one session keeps connections alive between requests instead of
+    paying a new TCP (and TLS) handshake for every health check and completion.
+    The session is closed once at interpreter exit.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=40)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+# Health probes are repeated every time a provider is built (and several
+# components build their own), so results are kept for a short while.
+_PROBE_TTL_SECONDS = 10.0
+_PROBE_CACHE: dict[str, tuple[float, bool]] = {}
+
+
+def _probe(url: str) -> bool:
+    """Return whether GET *url* answers 200, reusing a recent result."""
+    now = time.monotonic()
+    cached = _PROBE_CACHE.get(url)
+    if cached is not None and now - cached[0] < _PROBE_TTL_SECONDS:
+        return cached[1]
+    try:
+        ok = get_http_session().get(url, timeout=2).status_code == 200
+    except Exception as e:
+        logger.debug(f"Health probe failed for {url}: {e}")
+        ok = False
+    _PROBE_CACHE[url] = (now, ok)
+    return ok
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -71,35 +114,18 @@ class OllamaProvider(LLMProvider):
 
     def is_available(self) -> bool:
         """Check if Ollama service is reachable (tries Docker hostname and localhost)."""
-        try:
-            import requests
-
-            # Try primary endpoint
-            try:
-                with requests.Session() as session:
-                    response = session.get(f"{self.endpoint}/api/tags", timeout=2)
-                if response.status_code == 200:
-                    return True
-            except Exception:
-                logger.debug(f"Ollama not available at {self.endpoint}; trying fallback endpoint {self._fallback_endpoint}")    
-                pass
-
-            # Try fallback endpoint (localhost)
-            try:
-                with requests.Session() as session:
-                    response = session.get(f"{self._fallback_endpoint}/api/tags", timeout=2)
-                if response.status_code == 200:
-                    # Update endpoint to use localhost since Docker hostname didn't work
-                    self.endpoint = self._fallback_endpoint
-                    return True
-            except Exception:
-                logger.debug(f"Ollama not available at fallback endpoint {self._fallback_endpoint}")
-                pass
-
-            return False
-        except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
-            return False
+        # Try primary endpoint
+        if _probe(f"{self.endpoint}/api/tags"):
+            return True
+        logger.debug(f"Ollama not available at {self.endpoint}; trying fallback endpoint {self._fallback_endpoint}")
+
+        # Try fallback endpoint (localhost)
+        if _probe(f"{self._fallback_endpoint}/api/tags"):
+            # Update endpoint to use localhost since Docker hostname didn't work
+            self.endpoint = self._fallback_endpoint
+            return True
+        logger.debug(f"Ollama not available at fallback endpoint {self._fallback_endpoint}")
+        return False
 
     def create_chat_completion(
         self, messages: list[dict], model: Optional[str] = None, **kwargs
@@ -113,39 +139,38 @@ class OllamaProvider(LLMProvider):
             if model is None:
                 model = os.environ.get("OLLAMA_AGENT_MODEL", "qwen3-coder:latest")
 
-            # Use requests with explicit session cleanup
-            with requests.Session() as session:
-                response = session.post(
-                    f"{self.endpoint}/api/chat",
-                    json={
-                        "model": model,
-                        "messages": messages,
-                        "stream": False,  # Disable streaming for simpler response handling
-                        **kwargs,
-                    },
-                    timeout=300,
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Normalize response to match OpenAI format
-                usage = {
-                    "prompt_tokens": data.get("prompt_eval_count", 0),
-                    "completion_tokens": data.get("eval_count", 0),
-                }
-                usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
-                return {
-                    "choices": [
-                        {
-                            "message": {
-                                "role": "assistant",
-                                "content": data.get("message", {}).get("content", ""),
-                            }
-                        }
-                    ],
+            # Use the shared pooled session so the connection stays alive
+            response = get_http_session().post(
+                f"{self.endpoint}/api/chat",
+                json={
                     "model": model,
-                    "usage": usage,
-                }
+                    "messages": messages,
+                    "stream": False,  # Disable streaming for simpler response handling
+                    **kwargs,
+                },
+                timeout=300,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            # Normalize response to match OpenAI format
+            usage = {
+                "prompt_tokens": data.get("prompt_eval_count", 0),
+                "completion_tokens": data.get("eval_count", 0),
+            }
+            usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+            return {
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": data.get("message", {}).get("content", ""),
+                        }
+                    }
+                ],
+                "model": model,
+                "usage": usage,
+            }
         except requests.exceptions.Timeout as e:
             logger.error(f"Ollama chat completion timeout: {e}")
             raise TimeoutError(f"Ollama request timed out after 300 seconds") from e
@@ -174,15 +199,7 @@ class VLLMProvider(LLMProvider):
 
     def is_available(self) -> bool:
         """Check if vLLM service is reachable."""
-        try:
-            import requests
-
-            with requests.Session() as session:
-                response = session.get(f"{self.api_url}/health", timeout=2)
-            return response.status_code == 200
-        except Exception as e:
-            logger.debug(f"vLLM not available: {e}")
-            return False
+        return _probe(f"{self.api_url}/health")
 
     def create_chat_completion(
         self, messages: list[dict], model: Optional[str] = None, **kwargs
@@ -194,16 +211,15 @@ class VLLMProvider(LLMProvider):
             if model is None:
                 model = os.environ.get("VLLM_MODEL", "meta-llama/Llama-2-7b")
 
-            with requests.Session() as session:
-                response = session.post(
-                    f"{self.api_url}/v1/chat/completions",
-                    json={
-                        "model": model,
-                        "messages": messages,
-                        **kwargs,
-                    },
-                    timeout=300,
-                )
+            response = get_http_session().post(
+                f"{self.api_url}/v1/chat/completions",
+                json={
+                    "model": model,
+                    "messages": messages,
+                    **kwargs,
+                },
+                timeout=300,
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.Timeout as e:
@@ -5,6 +5,7 @@ NeoFlow MCP server running with SSE transport over HTTP.
 """
 
 import asyncio
+import importlib.util
 import json
 import logging
 import sys
@@ -14,6 +15,25 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Every message crosses the proxy twice (parse + re-serialize), so use orjson
+# when it is installed. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+# so error handling is the same either way. Output is UTF-8 bytes written to
+# the binary stdout, so it does not depend on the console's text encoding.
+try:
+    import orjson
+
+    def _loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(message: Any) -> bytes:
+        return orjson.dumps(message)
+except ImportError:
+    def _loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
 
 class MCPHTTPProxy:
     """Proxy that bridges stdio (local) to HTTP/SSE (remote) for MCP protocol."""
@@ -29,7 +49,21 @@ class MCPHTTPProxy:
         self.sse_url = f"{self.remote_url}/sse"
         self.messages_url = f"{self.remote_url}/messages"
         self.auth_token = auth_token
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.headers = {"Content-Type": "application/json"}
+        if auth_token:
+            self.headers["Authorization"] = f"Bearer {auth_token}"
+        # Keep the connection to the remote server alive between messages and
+        # negotiate HTTP/2 when the optional h2 package is installed (e.g. when
+        # the server sits behind a TLS-terminating reverse proxy).
+        self.client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0,
+            ),
+        )
         
     async def forward_to_remote(self, message: dict[str, Any]) -> dict[str, Any]:
         """Forward an MCP message to the remote server via HTTP POST.
@@ -40,18 +74,14 @@ class MCPHTTPProxy:
         Returns:
             Response from remote server
         """
-        headers = {"Content-Type": "application/json"}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-        
         try:
             response = await self.client.post(
                 self.messages_url,
                 json=message,
-                headers=headers,
+                headers=self.headers,
             )
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except httpx.HTTPError as e:
             logger.error(f"HTTP request failed: {e}")
             return {
@@ -81,7 +111,7 @@ class MCPHTTPProxy:
             return None
         
         try:
-            return json.loads(line)
+            return _loads(line)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from stdin: {e}")
             return None
@@ -92,9 +122,8 @@ class MCPHTTPProxy:
         Args:
             message: Message to write
         """
-        json_str = json.dumps(message)
-        sys.stdout.write(json_str + "\n")
-        sys.stdout.flush()
+        sys.stdout.buffer.write(_dumps(message) + b"\n")
+        sys.stdout.buffer.flush()
     
     async def run(self) -> None:
         """Run the proxy, forwarding between stdin/stdout and HTTP."""
@@ -11,7 +11,7 @@ from typing import Any
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 
-from neoflow.config import Config
+from neoflow.config import Config, get_config
 from neoflow.mcp.tools import (
     ASK_CHAT_SCHEMA,
     SEARCH_CODE_SCHEMA,
@@ -38,7 +38,7 @@ def create_mcp_server(config: Config | None = None) -> Server:
         Configured MCP Server instance
     """
     if config is None:
-        config = Config.from_env()
+        config = get_config()
     
     # Create MCP server with NeoFlow branding
     server = Server("neoflow")
@@ -161,7 +161,7 @@ async def run_mcp_server(transport: str = "stdio", config: Config | None = None)
         config: Application configuration
     """
     if config is None:
-        config = Config.from_env()
+        config = get_config()
     
     server = create_mcp_server(config)
     
@@ -117,8 +117,15 @@ def strip_json_blocks(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 def _weaviate_client(config: Config):
-    """Create a Weaviate client using the app config."""
-    return create_weaviate_client(config)
+    """Return the shared Weaviate client if one is attached, else create one."""
+    shared = getattr(config, "weaviate_client_instance", None)
+    return shared or create_weaviate_client(config)
+
+
+def _release_client(client, config: Config) -> None:
+    """Close *client* unless it is the shared client owned by the caller."""
+    if client is not getattr(config, "weaviate_client_instance", None):
+        client.close()
 
 
 # ---------------------------------------------------------------------------
@@ -220,7 +227,7 @@ def search_code(
 
         return "\n\n".join(parts)
     finally:
-        client.close()
+        _release_client(client, config)
 
 
 def search_documentation(
@@ -254,7 +261,7 @@ def search_documentation(
 
         return "\n\n".join(parts)
     finally:
-        client.close()
+        _release_client(client, config)
 
 
 def search_tickets(
@@ -334,7 +341,7 @@ def search_tickets(
 
         return "\n\n".join(parts)
     finally:
-        client.close()
+        _release_client(client, config)
 
 
 def get_full_ticket(
@@ -408,6 +415,6 @@ def get_full_ticket(
         return output
         
     finally:
-        client.close()
+        _release_client(client, config)
 
 
@@ -99,6 +99,11 @@ class StatusBar:
             self._thread.join(timeout=2)
             self._thread = None
 
+    def reset(self) -> None:
+        """Clear counters, message and tasks so a stopped bar can be reused."""
+        with self._lock:
+            self._state = StatusState()
+
     def pause(self) -> None:
         """Pause status rendering (used during prompt input)."""
         self._paused = True
@@ -1,5 +1,6 @@
 """YAML template loader and form runner for the /t= command."""
 
+import functools
 import os
 from dataclasses import dataclass
 
@@ -10,6 +11,11 @@ from rich.prompt import Prompt
 
 from neoflow.init import bootstrap_user_resource_folders, get_neoflow_templates_dir
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class TemplateError(Exception):
     """Raised when a template is missing or invalid."""
@@ -30,6 +36,13 @@ def _resolve_templates_dir(templates_dir: str | None = None) -> str:
     return str(get_neoflow_templates_dir())
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int):
+    """Parse *path*; keyed on its mtime so edited templates are re-read."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def load_template(name: str, templates_dir: str | None = None) -> dict:
     """Load and validate a YAML template by name.
 
@@ -57,8 +70,7 @@ def load_template(name: str, templates_dir: str | None = None) -> dict:
         hint = f" Available: {', '.join(available)}" if available else ""
         raise TemplateError(f"Template '{name}' not found.{hint}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _parse_yaml(path, os.stat(path).st_mtime_ns)
 
     if not isinstance(data, dict):
         raise TemplateError(f"Template '{name}' is not a valid YAML mapping.")
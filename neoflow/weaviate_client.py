@@ -1,9 +1,18 @@
+import functools
+from contextlib import nullcontext
+
 import weaviate
 from weaviate.config import AdditionalConfig, Timeout
 
 from neoflow.config import Config
 
 
+@functools.lru_cache(maxsize=8)
+def _additional_config(init: int, query: int, insert: int) -> AdditionalConfig:
+    """Return a shared ``AdditionalConfig`` for the given timeout triple."""
+    return AdditionalConfig(timeout=Timeout(init=init, query=query, insert=insert))
+
+
 def create_weaviate_client(
     config: Config,
     timeout_init: int | None = None,
@@ -12,12 +21,10 @@ def create_weaviate_client(
 ):
     """Create a Weaviate client that always honors configured connection settings."""
     wv = config.weaviate
-    additional_config = AdditionalConfig(
-        timeout=Timeout(
-            init=timeout_init if timeout_init is not None else wv.timeout_init,
-            query=timeout_query if timeout_query is not None else wv.timeout_query,
-            insert=timeout_insert if timeout_insert is not None else wv.timeout_insert,
-        )
+    additional_config = _additional_config(
+        timeout_init if timeout_init is not None else wv.timeout_init,
+        timeout_query if timeout_query is not None else wv.timeout_query,
+        timeout_insert if timeout_insert is not None else wv.timeout_insert,
     )
 
     grpc_host = wv.grpc_host or wv.host
@@ -31,3 +38,14 @@ def create_weaviate_client(
         grpc_secure=wv.grpc_secure,
         additional_config=additional_config,
     )
+
+
+def weaviate_client_scope(config: Config, client=None):
+    """Return a context manager yielding a Weaviate client.
+
+    When *client* is given it is yielded as-is and left open for its owner;
+    otherwise a new client is created and closed when the block exits.
+    """
+    if client is not None:
+        return nullcontext(client)
+    return create_weaviate_client(config)
@@ -0,0 +1,54 @@
+"""Regression tests for the code chunker's text and line ranges."""
+
+from neoflow.importer.code_indexer import OVERLAP_LINES, _prepare_code_file, make_chunker
+
+# line_end is line_start plus the chunk's newline count, so a chunk that ends
+# in "\n" reports one past its last line; these tests pin that convention.
+
+
+def test_blank_run_advances_line_start_past_overlap():
+    chunks = make_chunker(10)("\n" * 25)
+
+    assert OVERLAP_LINES == 2
+    assert chunks == [
+        ("\n" * 10, 1, 11),
+        ("\n" * 10, 9, 19),
+        ("\n" * 9, 17, 26),
+    ]
+
+
+def test_repeated_lines_get_distinct_ranges():
+    chunks = make_chunker(30)("x = 1\n" * 12)
+
+    assert chunks == [
+        ("x = 1\n" * 5, 1, 6),
+        ("x = 1\n" * 5, 4, 9),
+        ("x = 1\n" * 5, 7, 12),
+        ("x = 1\n" * 3, 10, 13),
+    ]
+
+
+def test_overlap_lines_repeat_at_the_start_of_the_next_chunk():
+    content = "def a():\n    return 1\n\ndef b():\n    return 2\n"
+
+    assert make_chunker(30)(content) == [
+        ("def a():\n    return 1\n\n", 1, 4),
+        ("    return 1\n\ndef b():\n", 2, 5),
+        ("\ndef b():\n    return 2\n", 3, 6),
+    ]
+
+
+def test_small_file_is_a_single_chunk():
+    content = "def a():\n    pass\ndef b():\n    pass\n"
+
+    assert make_chunker(1000)(content) == [(content, 1, 5)]
+
+
+def test_prepared_records_carry_ranges_and_definitions():
+    source = b"def a():\n    return 1\n\ndef b():\n    return 2\n"
+
+    records = _prepare_code_file(("pkg/m.py", source), 30)
+
+    assert [
+        (r["chunk_index"], r["line_start"], r["line_end"], r["definitions"]) for r in records
+    ] == [(0, 1, 4, "a"), (1, 2, 5, "b"), (2, 3, 6, "b")]
@@ -0,0 +1,87 @@
+"""Tests for the built-in .env parser used by the CLI."""
+
+import os
+import sys
+import types
+
+import pytest
+
+from neoflow.cli import _load_env_file, _parse_env_file
+
+
+def _write(tmp_path, text: str) -> str:
+    path = tmp_path / ".env"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_plain_values_comments_and_blank_lines(tmp_path):
+    path = _write(tmp_path, "# comment\n\nWEAVIATE_HOST=localhost\n  WEAVIATE_PORT = 8080  \n")
+
+    assert _parse_env_file(path) == {"WEAVIATE_HOST": "localhost", "WEAVIATE_PORT": "8080"}
+
+
+def test_quoted_values_keep_spaces_and_hashes(tmp_path):
+    path = _write(tmp_path, "A=\"hello world # not a comment\"\nB='single'\nC=\"\"\n")
+
+    assert _parse_env_file(path) == {"A": "hello world # not a comment", "B": "single", "C": ""}
+
+
+def test_inline_comment_needs_preceding_whitespace(tmp_path):
+    path = _write(tmp_path, "A=value # trailing comment\nB=value#kept\n")
+
+    assert _parse_env_file(path) == {"A": "value", "B": "value#kept"}
+
+
+def test_empty_value(tmp_path):
+    path = _write(tmp_path, "SERVER_API_KEY=\n")
+
+    assert _parse_env_file(path) == {"SERVER_API_KEY": ""}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "export OPENAI_API_KEY=abc\n",
+        "A=\"unterminated\n",
+        "A=${HOME}/data\n",
+        "A=line\\nbreak\n",
+        "NOT A KEY VALUE LINE\n",
+    ],
+)
+def test_unsupported_syntax_defers_to_dotenv(tmp_path, text):
+    assert _parse_env_file(_write(tmp_path, text)) is None
+
+
+def test_load_falls_back_to_dotenv(tmp_path, monkeypatch):
+    calls = []
+    fake_dotenv = types.ModuleType("dotenv")
+    fake_dotenv.load_dotenv = lambda path, override=False: calls.append((path, override))
+    monkeypatch.setitem(sys.modules, "dotenv", fake_dotenv)
+    path = _write(tmp_path, "A='unterminated\n")
+
+    _load_env_file(path, override=True)
+
+    assert calls == [(path, True)]
+
+
+def test_load_keeps_existing_variables_without_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEOFLOW_TEST_KEPT", "from-env")
+    # Registered with monkeypatch so the value loaded below is undone too.
+    monkeypatch.setenv("NEOFLOW_TEST_NEW", "")
+    monkeypatch.delenv("NEOFLOW_TEST_NEW")
+    path = _write(tmp_path, "NEOFLOW_TEST_KEPT=from-file\nNEOFLOW_TEST_NEW=new\n")
+
+    _load_env_file(path)
+
+    assert os.environ["NEOFLOW_TEST_KEPT"] == "from-env"
+    assert os.environ["NEOFLOW_TEST_NEW"] == "new"
+
+
+def test_load_override_replaces_existing_variables(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEOFLOW_TEST_KEPT", "from-env")
+    path = _write(tmp_path, "NEOFLOW_TEST_KEPT=from-file\n")
+
+    _load_env_file(path, override=True)
+
+    assert os.environ["NEOFLOW_TEST_KEPT"] == "from-file"